@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import Callable, Any
 
 from homeassistant.components.binary_sensor import (
@@ -20,7 +21,7 @@ from .const import DOMAIN, sanitize_wheel_id
 from .coordinator import EucChargingCoordinator
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class EucChargingBinarySensorDescription(BinarySensorEntityDescription):
     """Class describing Leaperkim binary sensor entities."""
     value_fn: Callable[[dict[str, Any]], bool | None] = lambda x: None
@@ -31,7 +32,7 @@ BINARY_SENSORS: tuple[EucChargingBinarySensorDescription, ...] = (
         key="is_charging",
         name="Charging",
         device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
-        value_fn=lambda data: data.get("is_charging", False),  # Default to False if not present
+        value_fn=itemgetter("is_charging"),  # Missing key is treated as not charging in is_on
     ),
 )
 
@@ -45,7 +46,7 @@ async def async_setup_entry(
     coordinator: EucChargingCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     async_add_entities(
-        EucChargingBinarySensor(coordinator, description) for description in BINARY_SENSORS
+        [EucChargingBinarySensor(coordinator, description) for description in BINARY_SENSORS]
     )
 
 
@@ -74,18 +75,7 @@ class EucChargingBinarySensor(CoordinatorEntity[EucChargingCoordinator], BinaryS
     @property
     def device_info(self) -> DeviceInfo:
         """Return the device info."""
-        data = self.coordinator.data or {}
-        model = data.get("model", "Unknown Model")
-        manufacturer = data.get("manufacturer", "Leaperkim")
-        sw_version = data.get("version")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.ble_device.address)},
-            name=f"{manufacturer} {model} ({self.coordinator.ble_device.name})",
-            manufacturer=manufacturer,
-            model=model,
-            sw_version=sw_version,
-        )
+        return self.coordinator.get_device_info()
 
     @property
     def available(self) -> bool:
@@ -102,7 +92,10 @@ class EucChargingBinarySensor(CoordinatorEntity[EucChargingCoordinator], BinaryS
             return False
         # For is_charging, default to False if not explicitly set
         # This ensures we show Off instead of Unknown when connected but not charging
-        result = self.entity_description.value_fn(self.coordinator.data)
+        try:
+            result = self.entity_description.value_fn(self.coordinator.data)
+        except KeyError:
+            result = None
         if self.entity_description.key == "is_charging" and result is None:
             return False
         return result
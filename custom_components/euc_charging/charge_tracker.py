@@ -3,27 +3,52 @@
 from __future__ import annotations
 
 import logging
-from collections import deque
-from dataclasses import dataclass
-from time import time
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+from math import exp, log
+from time import monotonic
 from typing import Optional
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChargeEstimates:
-    """Estimated times to reach charge levels."""
+    """Estimated times to reach charge levels.
+    
+    Frozen because the tracker hands out the same cached instance between updates.
+    The formatted times are filled in once at construction, since every sensor
+    reads them on each coordinator update.
+    """
     time_to_80: int | None = None   # Minutes
     time_to_90: int | None = None
     time_to_95: int | None = None
     time_to_100: int | None = None
     charge_rate_pct: float = 0.0     # Percent per minute (current rate)
     averaging_window: str = "unknown"  # Which time window was used for calculation
+    time_to_80_formatted: str | None = field(init=False, default=None, repr=False)
+    time_to_90_formatted: str | None = field(init=False, default=None, repr=False)
+    time_to_95_formatted: str | None = field(init=False, default=None, repr=False)
+    time_to_100_formatted: str | None = field(init=False, default=None, repr=False)
+    
+    def __post_init__(self) -> None:
+        """Format the estimated times once."""
+        # Frozen dataclass, so fields are set through object.__setattr__
+        format_time = ChargeEstimates.format_time
+        object.__setattr__(self, "time_to_80_formatted", format_time(self.time_to_80))
+        object.__setattr__(self, "time_to_90_formatted", format_time(self.time_to_90))
+        object.__setattr__(self, "time_to_95_formatted", format_time(self.time_to_95))
+        object.__setattr__(self, "time_to_100_formatted", format_time(self.time_to_100))
     
-    def format_time(self, minutes: int | None) -> str | None:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def format_time(minutes: int | None) -> str | None:
         """Format time in minutes as H:MM hr format.
         
+        Results are cached since estimates repeat the same few minute values.
+        
         Args:
             minutes: Time in minutes
             
@@ -47,26 +72,32 @@ class ChargeEstimates:
         hours = minutes // 60
         mins = minutes % 60
         return f"{hours}:{mins:02d} hr"
+
+
+def _interpolate_curve(points: list[tuple[float, float]], soc: float) -> float:
+    """Piecewise-linear interpolation of a (soc, factor) curve."""
+    # Find the two points that bracket the current SOC
+    for i in range(len(points) - 1):
+        soc1, factor1 = points[i]
+        soc2, factor2 = points[i + 1]
+        
+        if soc1 <= soc <= soc2:
+            # Linear interpolation between the two points
+            if soc2 == soc1:
+                return factor1
+            ratio = (soc - soc1) / (soc2 - soc1)
+            return factor1 + (factor2 - factor1) * ratio
     
-    @property
-    def time_to_80_formatted(self) -> str | None:
-        """Get formatted time to 80%."""
-        return self.format_time(self.time_to_80)
-    
-    @property
-    def time_to_90_formatted(self) -> str | None:
-        """Get formatted time to 90%."""
-        return self.format_time(self.time_to_90)
-    
-    @property
-    def time_to_95_formatted(self) -> str | None:
-        """Get formatted time to 95%."""
-        return self.format_time(self.time_to_95)
-    
-    @property
-    def time_to_100_formatted(self) -> str | None:
-        """Get formatted time to 100%."""
-        return self.format_time(self.time_to_100)
+    # If beyond 100%, return the slowest factor
+    if soc >= 100:
+        return points[-1][1]
+    # If below 0%, return full speed
+    return points[0][1]
+
+
+def _build_speed_factor_lut(points: list[tuple[float, float]]) -> tuple[float, ...]:
+    """Sample a (soc, factor) curve at every 0.5% from 0 to 100%."""
+    return tuple(_interpolate_curve(points, i * 0.5) for i in range(201))
 
 
 class LiIonChargeModel:
@@ -94,6 +125,13 @@ class LiIonChargeModel:
         (100, 0.05),   # 100%: Nearly stopped
     ]
     
+    # Breakpoint SOCs and factors as parallel tuples for bisect segment lookup
+    _SOC_POINTS, _FACTOR_POINTS = zip(*CURVE_POINTS)
+    
+    # Speed factor sampled every 0.5% (index = soc * 2), built once from CURVE_POINTS.
+    # All breakpoints fall on the grid, so interpolating between entries is exact.
+    _SPEED_FACTOR_LUT: tuple[float, ...] = _build_speed_factor_lut(CURVE_POINTS)
+    
     @classmethod
     def get_speed_factor(cls, soc: float) -> float:
         """Get the relative charging speed factor at a given state of charge.
@@ -104,23 +142,17 @@ class LiIonChargeModel:
         Returns:
             Speed factor (1.0 = full speed, 0.5 = half speed, etc.)
         """
-        # Find the two points that bracket the current SOC
-        for i in range(len(cls.CURVE_POINTS) - 1):
-            soc1, factor1 = cls.CURVE_POINTS[i]
-            soc2, factor2 = cls.CURVE_POINTS[i + 1]
-            
-            if soc1 <= soc <= soc2:
-                # Linear interpolation between the two points
-                if soc2 == soc1:
-                    return factor1
-                ratio = (soc - soc1) / (soc2 - soc1)
-                return factor1 + (factor2 - factor1) * ratio
-        
-        # If beyond 100%, return the slowest factor
+        lut = cls._SPEED_FACTOR_LUT
+        # Below 0% is full speed, beyond 100% is the slowest factor
+        if soc <= 0:
+            return lut[0]
         if soc >= 100:
-            return cls.CURVE_POINTS[-1][1]
-        # If below 0%, return full speed
-        return cls.CURVE_POINTS[0][1]
+            return lut[-1]
+        
+        idx = soc * 2.0
+        i = int(idx)
+        low = lut[i]
+        return low + (idx - i) * (lut[i + 1] - low)
     
     @classmethod
     def estimate_time_to_target(cls, current_soc: float, target_soc: float, 
@@ -146,32 +178,95 @@ class LiIonChargeModel:
         # Estimate the "base" charging rate (what it would be in CC phase)
         base_rate = current_rate_pct_min / current_factor
         
-        # Integrate over the charge curve from current to target
-        # We'll use small steps to account for the non-linear curve
-        step_size = 0.5  # 0.5% steps for reasonable accuracy
+        # The speed factor is linear within each curve segment, so the time
+        # integral of d(soc) / (base_rate * factor) has a closed form per segment:
+        # (b - a) / (f(b) - f(a)) * ln(f(b) / f(a)), or (b - a) / f for flat ones
         total_time = 0.0
-        soc = current_soc
-        
-        while soc < target_soc:
-            next_soc = min(soc + step_size, target_soc)
-            mid_soc = (soc + next_soc) / 2
-            
-            # Get speed factor at the midpoint
-            factor = cls.get_speed_factor(mid_soc)
-            
-            # Calculate time for this segment
-            # time = distance / speed = (percent_to_charge) / (rate * factor)
-            segment_percent = next_soc - soc
-            if factor > 0:
-                segment_rate = base_rate * factor
-                segment_time = segment_percent / segment_rate
-                total_time += segment_time
+        socs = cls._SOC_POINTS
+        factors = cls._FACTOR_POINTS
+        # Start at the segment containing current_soc and stop once target_soc is passed
+        i = max(bisect_right(socs, current_soc) - 1, 0)
+        last = len(socs) - 1
+        while i < last and socs[i] < target_soc:
+            soc1, soc2 = socs[i], socs[i + 1]
+            factor1, factor2 = factors[i], factors[i + 1]
+            i += 1
+            low = max(soc1, current_soc)
+            high = min(soc2, target_soc)
+            if high <= low:
+                continue
             
-            soc = next_soc
+            slope = (factor2 - factor1) / (soc2 - soc1)
+            factor_low = factor1 + slope * (low - soc1)
+            factor_high = factor1 + slope * (high - soc1)
+            if factor_high == factor_low:
+                total_time += (high - low) / factor_low
+            else:
+                total_time += (high - low) / (factor_high - factor_low) * log(factor_high / factor_low)
+        
+        total_time /= base_rate
         
         return int(round(total_time))
 
 
+class _WindowRegression:
+    """Sliding-window least-squares fit of SOC against time.
+    
+    Keeps Welford-style running means and centered co-moments so samples can be
+    added on the right and removed on the left in O(1) without the cancellation
+    of raw sum-of-products formulas.
+    """
+    
+    __slots__ = ("window_seconds", "left", "n", "mean_t", "mean_soc", "m2_t", "c_t_soc")
+    
+    def __init__(self, window_seconds: float) -> None:
+        """Initialize an empty window."""
+        self.window_seconds = window_seconds
+        self.left = 0  # Index of the oldest sample inside the window
+        self.reset()
+    
+    def reset(self) -> None:
+        """Drop all samples from the fit."""
+        self.n = 0
+        self.mean_t = 0.0
+        self.mean_soc = 0.0
+        self.m2_t = 0.0
+        self.c_t_soc = 0.0
+    
+    def add(self, t: float, soc: float) -> None:
+        """Add a sample to the fit."""
+        self.n += 1
+        dt = t - self.mean_t
+        self.mean_t += dt / self.n
+        self.mean_soc += (soc - self.mean_soc) / self.n
+        self.m2_t += dt * (t - self.mean_t)
+        self.c_t_soc += dt * (soc - self.mean_soc)
+    
+    def remove(self, t: float, soc: float) -> None:
+        """Remove a previously added sample from the fit."""
+        if self.n <= 1:
+            self.reset()
+            return
+        self.n -= 1
+        old_mean_t = self.mean_t
+        old_mean_soc = self.mean_soc
+        self.mean_t -= (t - old_mean_t) / self.n
+        self.mean_soc -= (soc - old_mean_soc) / self.n
+        # Inverse of add(): the deltas pair the new mean of one axis with the old of the other
+        dt = t - self.mean_t
+        self.m2_t -= dt * (t - old_mean_t)
+        self.c_t_soc -= dt * (soc - old_mean_soc)
+        if self.m2_t < 0:
+            self.m2_t = 0.0
+    
+    @property
+    def slope(self) -> Optional[float]:
+        """Return the fitted slope, or None if the samples span no time."""
+        if self.n < 2 or self.m2_t <= 0:
+            return None
+        return self.c_t_soc / self.m2_t
+
+
 class ChargeTracker:
     """Tracks charging progress and estimates completion times using Li-ion charge curves.
     
@@ -182,21 +277,28 @@ class ChargeTracker:
     - 1 hour window: Maximum accuracy (after 1 hour of data)
     """
 
-    def __init__(self, max_samples: int = 3600, update_interval: int = 45, smoothing_alpha: float = 0.1) -> None:
+    def __init__(self, max_samples: int = 3600, update_interval: int = 45, smoothing_tau: float = 300.0) -> None:
         """Initialize the tracker.
         
         Args:
             max_samples: Maximum number of samples to keep (default 3600 = 1 hour at 1 sample/sec)
             update_interval: Seconds between estimate updates to prevent jumping values (default 45)
-            smoothing_alpha: Exponential smoothing factor (0-1). Lower = smoother, higher = more responsive (default 0.3)
+            smoothing_tau: Rate smoothing time constant in seconds. Higher = smoother, lower = more responsive (default 300)
         """
-        # Store tuples of (timestamp, battery_percent, voltage)
+        # Sample history as parallel preallocated ring buffers (timestamp, battery_percent, voltage)
         # Keep up to 1 hour of history for long-term averaging
-        self._history: deque[tuple[float, float, float]] = deque(maxlen=max_samples)
+        # Timestamps are seconds since the first sample of the session.
+        # Sample number n of the session lives in slot n % max_samples.
+        self._max_samples = max_samples
+        self._origin: float | None = None
+        self._count = 0  # Samples appended this session
+        self._times = array("d", bytes(8 * max_samples))
+        self._socs = array("d", bytes(8 * max_samples))
+        self._voltages = array("d", bytes(8 * max_samples))
         self._last_estimate: ChargeEstimates | None = None
         self._last_update_time: float = 0.0  # When we last updated the estimate
         self._update_interval: int = update_interval  # Seconds between updates
-        self._smoothing_alpha: float = smoothing_alpha  # EMA smoothing factor
+        self._smoothing_tau: float = smoothing_tau  # EMA time constant (seconds)
         self._smoothed_rate: float | None = None  # Exponentially smoothed rate
         
         # Adaptive time windows (in seconds)
@@ -207,6 +309,11 @@ class ChargeTracker:
             (1800, "30min"),   # 30 minutes - high accuracy
             (3600, "1hour"),   # 1 hour - maximum accuracy
         ]
+        # One sliding regression per window, advanced as samples arrive.
+        # The 1 minute window also covers the shorter startup fallback window.
+        self._windows = [
+            _WindowRegression(window_seconds) for window_seconds, _ in self._time_windows
+        ]
 
     def update(self, battery_percent: float, is_charging: bool, 
                voltage: float = 0.0) -> ChargeEstimates:
@@ -217,39 +324,34 @@ class ChargeTracker:
             is_charging: Whether the device is currently charging
             voltage: Current battery voltage (for future use)
         """
-        now = time()
+        # Monotonic clock so NTP or DST adjustments can't distort the regression;
+        # nothing is persisted across restarts, so its arbitrary epoch doesn't matter
+        now = monotonic()
         
         if not is_charging:
             # Reset everything when not charging
-            if self._history:  # Only log if we were tracking
+            if self._count:  # Only log if we were tracking
                 _LOGGER.info("Charging stopped (is_charging=False), clearing history")
-            self._history.clear()
+            self._clear_history()
             self._last_estimate = None
             self._last_update_time = 0.0
             self._smoothed_rate = None
             return ChargeEstimates()
 
-        # Add new sample
-        is_first_sample = len(self._history) == 0
-        self._history.append((now, battery_percent, voltage))
-        
-        if is_first_sample:
-            _LOGGER.info(
-                "Charging started at %.1f%%. Collecting data for charge time estimates...",
-                battery_percent
-            )
-        
         # Special case: If battery is at or very near 100%, return estimates immediately
-        # No need to wait for data collection or calculate rates
+        # No need to wait for data collection or calculate rates, and the sample
+        # is not recorded so a long trickle-charge tail doesn't flood the history
         if battery_percent >= 99.5:
+            if self._last_estimate is not None and self._last_estimate.averaging_window == "instant":
+                return self._last_estimate
             estimates = ChargeEstimates(
+                time_to_80=0,
+                time_to_90=0,
+                time_to_95=0,
+                time_to_100=0,
                 charge_rate_pct=0.0,
                 averaging_window="instant",
             )
-            estimates.time_to_80 = 0
-            estimates.time_to_90 = 0
-            estimates.time_to_95 = 0
-            estimates.time_to_100 = 0
             self._last_estimate = estimates
             _LOGGER.debug(
                 "Battery at %.1f%%, returning immediate estimates (all zeros)",
@@ -257,35 +359,43 @@ class ChargeTracker:
             )
             return estimates
         
+        # Add new sample
+        is_first_sample = not self._count
+        self._append_sample(now, battery_percent, voltage)
+        
+        if is_first_sample:
+            _LOGGER.info(
+                "Charging started at %.1f%%. Collecting data for charge time estimates...",
+                battery_percent
+            )
+        
         # Check if enough time has passed since last update to prevent jumping values
         # Always calculate on first estimate or when window would change
-        time_since_last_update = now - self._last_update_time
-        should_update = (
-            self._last_estimate is None or  # First estimate
-            time_since_last_update >= self._update_interval  # Enough time passed
-        )
-        
-        if not should_update:
-            # Return the cached estimate to prevent jumping
-            # If we have a cached estimate, return it; otherwise return empty estimate
-            if self._last_estimate:
-                return self._last_estimate
-            # This shouldn't happen (should_update would be True if _last_estimate is None)
-            # but handle it just in case
-            return ChargeEstimates()
+        if (
+            self._last_estimate is not None
+            and now - self._last_update_time < self._update_interval
+        ):
+            # Return the cached estimate to prevent jumping; the sample is
+            # already recorded, so nothing else needs to run until the next update
+            return self._last_estimate
         
         # Calculate the total time span of our data
-        total_time_span = now - self._history[0][0]
+        capacity = self._max_samples
+        oldest = max(self._count - capacity, 0)
+        total_time_span = self._times[(self._count - 1) % capacity] - self._times[oldest % capacity]
         
         # Determine which time window to use based on available data
         # Use the largest window that we have enough data for
-        selected_window_seconds = None
+        selected_window: _WindowRegression | None = None
         selected_window_name = "unknown"  # Default value
         
-        for window_seconds, window_name in self._time_windows:
+        for window, (window_seconds, window_name) in zip(
+            reversed(self._windows), reversed(self._time_windows)
+        ):
             if total_time_span >= window_seconds:
-                selected_window_seconds = window_seconds
+                selected_window = window
                 selected_window_name = window_name
+                break
         
         # Check if window changed - force update if so
         window_changed = (self._last_estimate is not None and 
@@ -293,9 +403,10 @@ class ChargeTracker:
         
         # If we don't have even 1 minute of data yet, try with what we have
         # but require at least 30 seconds to avoid noise
-        if selected_window_seconds is None:
+        if selected_window is None:
             if total_time_span >= 30:
-                selected_window_seconds = total_time_span
+                # The 1 minute window still holds every sample at this point
+                selected_window = self._windows[0]
                 selected_window_name = f"{int(total_time_span)}sec"
             else:
                 # Not enough data yet
@@ -306,7 +417,7 @@ class ChargeTracker:
                 return self._last_estimate or ChargeEstimates()
         
         # Calculate rate using data from the selected time window
-        raw_rate_pct_min = self._calculate_rate_for_window(selected_window_seconds)
+        raw_rate_pct_min = selected_window.slope
         
         # If rate is negative or too small, return previous estimates or special case
         if raw_rate_pct_min is None or raw_rate_pct_min <= 0.001:
@@ -323,68 +434,50 @@ class ChargeTracker:
                     battery_percent, raw_rate_pct_min
                 )
             
-            # Safety net: If battery reached 100% during charging, return zeros
-            # This shouldn't normally be reached as we check at the start
-            if battery_percent >= 99.5:
-                estimates = ChargeEstimates(
-                    charge_rate_pct=0.0,
-                    averaging_window=selected_window_name,
-                )
-                estimates.time_to_80 = 0
-                estimates.time_to_90 = 0
-                estimates.time_to_95 = 0
-                estimates.time_to_100 = 0
-                self._last_estimate = estimates
-                _LOGGER.debug(
-                    "Battery at %.1f%%, setting all time estimates to 0",
-                    battery_percent
-                )
-                return estimates
-            
             return self._last_estimate or ChargeEstimates()
 
         # Apply exponential smoothing to the rate to prevent rapid changes
         # Formula: smoothed = alpha * new_value + (1 - alpha) * old_value
-        # Lower alpha = more smoothing, higher alpha = more responsive
-        if self._smoothed_rate is None or window_changed:
-            # First estimate or window changed - use raw rate
+        # with alpha = 1 - exp(-dt / tau), so smoothing depends on elapsed time
+        # rather than on how often estimates happen to be recalculated
+        if self._smoothed_rate is None:
+            # First estimate - use raw rate
             rate_pct_min = raw_rate_pct_min
             self._smoothed_rate = raw_rate_pct_min
         else:
             # Apply exponential moving average
+            alpha = 1.0 - exp(-(now - self._last_update_time) / self._smoothing_tau)
             rate_pct_min = (
-                self._smoothing_alpha * raw_rate_pct_min + 
-                (1 - self._smoothing_alpha) * self._smoothed_rate
+                alpha * raw_rate_pct_min + 
+                (1 - alpha) * self._smoothed_rate
             )
             self._smoothed_rate = rate_pct_min
 
+        current_soc = battery_percent
+        
         # Create estimates using the Li-ion charge model
+        # Time to each target is 0 if already at or above it, otherwise calculated
         estimates = ChargeEstimates(
+            time_to_80=(
+                LiIonChargeModel.estimate_time_to_target(current_soc, 80.0, rate_pct_min)
+                if current_soc < 80.0 else 0
+            ),
+            time_to_90=(
+                LiIonChargeModel.estimate_time_to_target(current_soc, 90.0, rate_pct_min)
+                if current_soc < 90.0 else 0
+            ),
+            time_to_95=(
+                LiIonChargeModel.estimate_time_to_target(current_soc, 95.0, rate_pct_min)
+                if current_soc < 95.0 else 0
+            ),
+            time_to_100=(
+                LiIonChargeModel.estimate_time_to_target(current_soc, 100.0, rate_pct_min)
+                if current_soc < 100.0 else 0
+            ),
             charge_rate_pct=round(rate_pct_min, 3),
             averaging_window=selected_window_name,
         )
         
-        current_soc = battery_percent
-        
-        # Calculate time to each target using the charge curve model
-        # Return 0 if already at or above target, otherwise calculate
-        estimates.time_to_80 = (
-            LiIonChargeModel.estimate_time_to_target(current_soc, 80.0, rate_pct_min)
-            if current_soc < 80.0 else 0
-        )
-        estimates.time_to_90 = (
-            LiIonChargeModel.estimate_time_to_target(current_soc, 90.0, rate_pct_min)
-            if current_soc < 90.0 else 0
-        )
-        estimates.time_to_95 = (
-            LiIonChargeModel.estimate_time_to_target(current_soc, 95.0, rate_pct_min)
-            if current_soc < 95.0 else 0
-        )
-        estimates.time_to_100 = (
-            LiIonChargeModel.estimate_time_to_target(current_soc, 100.0, rate_pct_min)
-            if current_soc < 100.0 else 0
-        )
-        
         # Log when we first get valid estimates, when window changes, or periodically
         is_first_estimate = self._last_estimate is None or self._last_estimate.charge_rate_pct == 0
         
@@ -405,9 +498,10 @@ class ChargeTracker:
                 estimates.time_to_80_formatted, estimates.time_to_90_formatted,
                 estimates.time_to_95_formatted, estimates.time_to_100_formatted
             )
-        else:
+        elif _LOGGER.isEnabledFor(logging.DEBUG):
             # Regular update (every update_interval seconds)
             # Show difference between raw and smoothed to see how much smoothing is happening
+            # Gated so the formatted times aren't computed when debug logging is off
             rate_diff = abs(raw_rate_pct_min - rate_pct_min)
             _LOGGER.debug(
                 "Charge estimates updated: SOC=%.1f%%, Rate=%.3f%%/min (raw=%.3f, diff=%.3f, window: %s), "
@@ -423,48 +517,51 @@ class ChargeTracker:
         
         return estimates
     
-    def _calculate_rate_for_window(self, window_seconds: float) -> Optional[float]:
-        """Calculate charge rate using data from a specific time window.
-        
-        Args:
-            window_seconds: Size of the time window in seconds
-            
-        Returns:
-            Charge rate in %/min, or None if unable to calculate
-        """
-        if not self._history or len(self._history) < 2:
-            return None
-        
-        now = self._history[-1][0]
-        cutoff_time = now - window_seconds
-        
-        # Find the samples within the window
-        window_samples = []
-        for timestamp, soc, voltage in self._history:
-            if timestamp >= cutoff_time:
-                window_samples.append((timestamp, soc, voltage))
-        
-        if len(window_samples) < 2:
-            return None
-        
-        # Use linear regression for better noise resistance
-        # Convert timestamps to minutes from start of window
-        start_time = window_samples[0][0]
-        times = [(t - start_time) / 60.0 for t, _, _ in window_samples]
-        socs = [soc for _, soc, _ in window_samples]
-        
-        # Simple linear regression for % per minute
-        n = len(times)
-        sum_t = sum(times)
-        sum_soc = sum(socs)
-        sum_t_soc = sum(t * soc for t, soc in zip(times, socs))
-        sum_t_sq = sum(t * t for t in times)
-        
-        denominator = n * sum_t_sq - sum_t * sum_t
-        if denominator == 0:
-            return None
-        
-        # Slope = rate in %/min
-        rate_pct_min = (n * sum_t_soc - sum_t * sum_soc) / denominator
-        
-        return rate_pct_min
+    def _append_sample(self, timestamp: float, soc: float, voltage: float) -> None:
+        """Append a sample and slide every window regression forward."""
+        if self._origin is None:
+            self._origin = timestamp
+        t = timestamp - self._origin
+        
+        times = self._times
+        socs = self._socs
+        capacity = self._max_samples
+        index = self._count
+        
+        # The new sample overwrites the oldest one once the buffer is full, so
+        # drop it from every window before its slot is reused
+        oldest = index + 1 - capacity
+        for window in self._windows:
+            left = window.left
+            while left < oldest:
+                slot = left % capacity
+                window.remove(times[slot] / 60.0, socs[slot])
+                left += 1
+            window.left = left
+        
+        slot = index % capacity
+        times[slot] = t
+        socs[slot] = soc
+        self._voltages[slot] = voltage
+        self._count = index + 1
+        
+        # Regression time axis is in minutes so the slope comes out in %/min
+        t_min = t / 60.0
+        for window in self._windows:
+            window.add(t_min, soc)
+            cutoff_time = t - window.window_seconds
+            left = window.left
+            while times[left % capacity] < cutoff_time:
+                slot = left % capacity
+                window.remove(times[slot] / 60.0, socs[slot])
+                left += 1
+            window.left = left
+
+    def _clear_history(self) -> None:
+        """Drop all samples and restart the session time origin."""
+        # Buffer contents past _count are never read, so they are left in place
+        self._origin = None
+        self._count = 0
+        for window in self._windows:
+            window.left = 0
+            window.reset()
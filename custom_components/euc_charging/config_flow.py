@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any
 
 import voluptuous as vol
@@ -15,10 +16,20 @@ from homeassistant.config_entries import ConfigFlow, ConfigEntry
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN, SERVICE_UUID, DEVICE_NAMES, ALL_SERVICE_UUIDS
+from .const import (
+    DOMAIN,
+    SERVICE_UUID,
+    DEVICE_NAMES,
+    ALL_SERVICE_UUIDS,
+    ALL_SERVICE_UUIDS_SET,
+    match_device_name,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bluetooth MAC address, e.g. 88:25:83:F3:5D:30 (input is upper-cased first)
+_MAC_RE = re.compile(r'^([0-9A-F]{2}:){5}[0-9A-F]{2}$')
+
 
 class EucChargingConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Leaperkim EUC."""
@@ -49,6 +60,8 @@ class EucChargingConfigFlow(ConfigFlow, domain=DOMAIN):
         current_addresses = self._async_current_ids()
 
         _LOGGER.debug("Starting device discovery, scanning all Bluetooth devices...")
+        # Checked once per scan so per-device debug arguments are skipped when disabled
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
         all_devices_count = 0
         matching_by_service = 0
         matching_by_name = 0
@@ -57,17 +70,19 @@ class EucChargingConfigFlow(ConfigFlow, domain=DOMAIN):
             all_devices_count += 1
             address = discovery_info.address
             
-            _LOGGER.debug(
-                "Found BT device: %s (%s), Services: %s, Manufacturer: %s, RSSI: %s",
-                discovery_info.name or "Unknown",
-                address,
-                discovery_info.service_uuids,
-                discovery_info.manufacturer_data,
-                discovery_info.rssi,
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Found BT device: %s (%s), Services: %s, Manufacturer: %s, RSSI: %s",
+                    discovery_info.name or "Unknown",
+                    address,
+                    discovery_info.service_uuids,
+                    discovery_info.manufacturer_data,
+                    discovery_info.rssi,
+                )
             
             if address in current_addresses:
-                _LOGGER.debug("Skipping %s - already configured", address)
+                if debug_enabled:
+                    _LOGGER.debug("Skipping %s - already configured", address)
                 continue
             
             if address in self._discovered_devices:
@@ -79,20 +94,18 @@ class EucChargingConfigFlow(ConfigFlow, domain=DOMAIN):
                 continue
 
             # Match by service UUID (most reliable) - check all supported UUIDs
-            matched_by_uuid = False
-            for service_uuid in ALL_SERVICE_UUIDS:
-                if service_uuid in discovery_info.service_uuids:
-                    _LOGGER.info("Found EUC device by service UUID %s: %s (%s)", service_uuid, discovery_info.name, address)
-                    self._discovered_devices[address] = discovery_info
-                    matching_by_service += 1
-                    matched_by_uuid = True
-                    break
-            
-            if matched_by_uuid:
+            matched_uuids = ALL_SERVICE_UUIDS_SET.intersection(discovery_info.service_uuids)
+            if matched_uuids:
+                _LOGGER.info(
+                    "Found EUC device by service UUID %s: %s (%s)",
+                    next(iter(matched_uuids)), discovery_info.name, address,
+                )
+                self._discovered_devices[address] = discovery_info
+                matching_by_service += 1
                 continue
             
             # Fallback: Match by device name (for ESPHome proxies that may not forward service UUIDs)
-            if discovery_info.name and any(name in discovery_info.name for name in DEVICE_NAMES):
+            if match_device_name(discovery_info.name):
                 _LOGGER.info("Found EUC device by name match: %s (%s)", discovery_info.name, address)
                 self._discovered_devices[address] = discovery_info
                 matching_by_name += 1
@@ -166,8 +179,7 @@ class EucChargingConfigFlow(ConfigFlow, domain=DOMAIN):
             address = user_input[CONF_ADDRESS].upper().strip()
             
             # Validate MAC address format
-            import re
-            if not re.match(r'^([0-9A-F]{2}:){5}[0-9A-F]{2}$', address):
+            if not _MAC_RE.match(address):
                 errors[CONF_ADDRESS] = "invalid_mac"
             else:
                 await self.async_set_unique_id(address, raise_on_progress=False)
@@ -197,7 +209,7 @@ class EucChargingConfigFlow(ConfigFlow, domain=DOMAIN):
         self._abort_if_unique_id_configured()
 
         # Check if any of our supported service UUIDs are present
-        if any(uuid in discovery_info.service_uuids for uuid in ALL_SERVICE_UUIDS):
+        if not ALL_SERVICE_UUIDS_SET.isdisjoint(discovery_info.service_uuids):
             self._discovered_device = discovery_info
             return await self.async_step_bluetooth_confirm()
 
@@ -1,7 +1,11 @@
 """Constants for the EUC Charging integration."""
 
+from __future__ import annotations
+
 import re
-from enum import Enum
+from enum import IntEnum
+from itertools import chain
+from typing import NamedTuple
 
 DOMAIN = "euc_charging"
 
@@ -47,25 +51,86 @@ SERVICE_UUID = VETERAN_SERVICE_UUID
 NOTIFY_UUID = VETERAN_READ_UUID
 
 
-class WheelBrand(Enum):
-    """Supported EUC brands."""
-    UNKNOWN = "unknown"
-    KINGSONG = "kingsong"
-    GOTWAY = "gotway"
-    BEGODE = "begode"  # Alias for Gotway
-    VETERAN = "veteran"
-    LEAPERKIM = "leaperkim"  # Alias for Veteran
-    INMOTION = "inmotion"
-    INMOTION_V2 = "inmotion_v2"
-    NINEBOT = "ninebot"
-    NINEBOT_Z = "ninebot_z"
+class WheelBrand(IntEnum):
+    """Supported EUC brands.
+
+    Integer-valued so brand comparisons and dispatch table lookups hash ints;
+    use str_value/from_str for the lowercase string form.
+    """
+    UNKNOWN = 0
+    KINGSONG = 1
+    GOTWAY = 2
+    BEGODE = 3  # Alias for Gotway
+    VETERAN = 4
+    LEAPERKIM = 5  # Alias for Veteran
+    INMOTION = 6
+    INMOTION_V2 = 7
+    NINEBOT = 8
+    NINEBOT_Z = 9
+
+    @property
+    def str_value(self) -> str:
+        """Return the lowercase string form (e.g. "inmotion_v2")."""
+        return self.name.lower()
+
+    @classmethod
+    def from_str(cls, value: str) -> WheelBrand:
+        """Return the brand for a lowercase string form.
+
+        Raises:
+            ValueError: If the string does not name a brand
+        """
+        try:
+            return cls[value.upper()]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+# Keepalive intervals in seconds (InMotion streams only while polled every 25ms)
+INMOTION_KEEPALIVE_INTERVAL = 0.025
+DEFAULT_KEEPALIVE_INTERVAL = 1.0
+
+# Map brands to (read UUID, write UUID, requires keepalive, keepalive interval)
+# Aliases are listed explicitly so a single lookup resolves any brand
+BRAND_UUID_TABLE: dict[WheelBrand, tuple[str, str | None, bool, float]] = {
+    WheelBrand.KINGSONG: (KINGSONG_READ_UUID, None, False, DEFAULT_KEEPALIVE_INTERVAL),
+    WheelBrand.GOTWAY: (GOTWAY_READ_UUID, None, False, DEFAULT_KEEPALIVE_INTERVAL),
+    WheelBrand.BEGODE: (GOTWAY_READ_UUID, None, False, DEFAULT_KEEPALIVE_INTERVAL),
+    WheelBrand.VETERAN: (VETERAN_READ_UUID, None, False, DEFAULT_KEEPALIVE_INTERVAL),
+    WheelBrand.LEAPERKIM: (VETERAN_READ_UUID, None, False, DEFAULT_KEEPALIVE_INTERVAL),
+    WheelBrand.INMOTION: (
+        INMOTION_READ_UUID, INMOTION_WRITE_UUID, True, INMOTION_KEEPALIVE_INTERVAL
+    ),
+    WheelBrand.INMOTION_V2: (
+        INMOTION_V2_READ_UUID, INMOTION_V2_WRITE_UUID, True, INMOTION_KEEPALIVE_INTERVAL
+    ),
+    WheelBrand.NINEBOT: (
+        NINEBOT_READ_UUID, NINEBOT_WRITE_UUID, True, DEFAULT_KEEPALIVE_INTERVAL
+    ),
+    WheelBrand.NINEBOT_Z: (
+        NINEBOT_Z_READ_UUID, NINEBOT_Z_WRITE_UUID, True, DEFAULT_KEEPALIVE_INTERVAL
+    ),
+}
+
+# Fallback for unknown brands: Veteran/KingSong notify UUID, passive protocol
+DEFAULT_BRAND_UUIDS: tuple[str, str | None, bool, float] = (
+    NOTIFY_UUID, None, False, DEFAULT_KEEPALIVE_INTERVAL
+)
 
 
 # Map service UUIDs to brands (for discovery)
-SERVICE_UUID_TO_BRAND = {
-    KINGSONG_SERVICE_UUID: [WheelBrand.KINGSONG, WheelBrand.GOTWAY, WheelBrand.VETERAN, WheelBrand.NINEBOT],
-    INMOTION_SERVICE_UUID: [WheelBrand.INMOTION],
-    INMOTION_V2_SERVICE_UUID: [WheelBrand.INMOTION_V2, WheelBrand.NINEBOT_Z],
+# KingSong/Gotway/Veteran/Ninebot and InMotion V1 all advertise the same ffe0 service
+SERVICE_UUID_TO_BRAND: dict[str, tuple[WheelBrand, ...]] = {
+    KINGSONG_SERVICE_UUID: (
+        WheelBrand.KINGSONG, WheelBrand.GOTWAY, WheelBrand.VETERAN,
+        WheelBrand.NINEBOT, WheelBrand.INMOTION,
+    ),
+    INMOTION_V2_SERVICE_UUID: (WheelBrand.INMOTION_V2, WheelBrand.NINEBOT_Z),
+}
+
+# Reverse map for O(1) brand -> service UUID lookup
+BRAND_TO_SERVICE_UUID: dict[WheelBrand, str] = {
+    brand: uuid for uuid, brands in SERVICE_UUID_TO_BRAND.items() for brand in brands
 }
 
 # All unique service UUIDs for discovery
@@ -73,29 +138,117 @@ ALL_SERVICE_UUIDS = [
     KINGSONG_SERVICE_UUID,
     INMOTION_V2_SERVICE_UUID,
 ]
+ALL_SERVICE_UUIDS_SET: frozenset[str] = frozenset(SERVICE_UUID_TO_BRAND)
 
 # Brand-specific device name patterns for discovery
-BRAND_DEVICE_NAMES = {
-    WheelBrand.KINGSONG: ["KS-", "KingSong", "King Song"],
-    WheelBrand.GOTWAY: ["GW", "Gotway", "Begode", "MCM", "Monster", "MSX", "Nikola", "RS"],
-    WheelBrand.VETERAN: ["LK3336", "Sherman", "Veteran", "Abrams", "Patton", "Lynx", "Sherman L", "Oryx"],
-    WheelBrand.INMOTION: ["InMotion", "V5", "V8", "V10", "V11", "Glide"],
-    WheelBrand.INMOTION_V2: ["InMotion", "V11", "V12", "V13", "V14"],
-    WheelBrand.NINEBOT: ["Ninebot", "Nine", "A1", "C", "E+", "P", "S2", "miniPRO"],
-    WheelBrand.NINEBOT_Z: ["Ninebot Z", "Ninebot-Z", "Z6", "Z8", "Z10"],
+BRAND_DEVICE_NAMES: dict[WheelBrand, tuple[str, ...]] = {
+    WheelBrand.KINGSONG: ("KS-", "KingSong", "King Song"),
+    WheelBrand.GOTWAY: ("GW", "Gotway", "Begode", "MCM", "Monster", "MSX", "Nikola", "RS"),
+    WheelBrand.VETERAN: ("LK3336", "Sherman", "Veteran", "Abrams", "Patton", "Lynx", "Sherman L", "Oryx"),
+    WheelBrand.INMOTION: ("InMotion", "V5", "V8", "V10", "V11", "Glide"),
+    WheelBrand.INMOTION_V2: ("InMotion", "V11", "V12", "V13", "V14"),
+    WheelBrand.NINEBOT: ("Ninebot", "Nine", "A1", "C", "E+", "P", "S2", "miniPRO"),
+    WheelBrand.NINEBOT_Z: ("Ninebot Z", "Ninebot-Z", "Z6", "Z8", "Z10"),
 }
 
-# All device names for discovery
-DEVICE_NAMES = list({name for names in BRAND_DEVICE_NAMES.values() for name in names})
+# All device names for discovery (deduplicated, flattened at C level)
+DEVICE_NAMES: frozenset[str] = frozenset(chain.from_iterable(BRAND_DEVICE_NAMES.values()))
+
+# Lowercased name pattern -> brand; the first brand listing a pattern wins
+_BRAND_BY_PATTERN: dict[str, WheelBrand] = {}
+for _brand, _patterns in BRAND_DEVICE_NAMES.items():
+    for _pattern in _patterns:
+        _BRAND_BY_PATTERN.setdefault(_pattern.lower(), _brand)
+del _brand, _patterns, _pattern
+
+# Character trie over the lowercased patterns; a node's "" key holds its brand
+_BRAND_TRIE: dict = {}
+for _pattern, _brand in _BRAND_BY_PATTERN.items():
+    _node = _BRAND_TRIE
+    for _char in _pattern:
+        _node = _node.setdefault(_char, {})
+    _node[""] = _brand
+del _pattern, _brand, _node, _char
+
+
+def trie_match(name: str) -> WheelBrand | None:
+    """Return the brand of the longest pattern that prefixes a device name."""
+    node = _BRAND_TRIE
+    brand = None
+    for char in name.lower():
+        node = node.get(char)
+        if node is None:
+            break
+        brand = node.get("", brand)
+    return brand
+
+
+# Single alternation over every pattern, longest first so "Ninebot Z" beats "Ninebot"
+_BRAND_NAME_RE = re.compile(
+    "|".join(re.escape(p) for p in sorted(_BRAND_BY_PATTERN, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+
+def match_brand(name: str) -> WheelBrand | None:
+    """Return the brand whose name pattern appears in a device name.
+
+    Names that start with a known pattern (the usual case) resolve through
+    the prefix trie; anything else falls back to a single compiled regex
+    pass over all patterns instead of looping over every brand and pattern.
+
+    Args:
+        name: The Bluetooth device name
+
+    Returns:
+        Matching WheelBrand, or None if no pattern matches
+    """
+    if not name:
+        return None
+    brand = trie_match(name)
+    if brand is not None:
+        return brand
+    match = _BRAND_NAME_RE.search(name)
+    if match is None:
+        return None
+    return _BRAND_BY_PATTERN[match.group().lower()]
+
+
+# Discovery alternation over every known name, longest first so specific names win
+_DISCOVERY_RE = re.compile(
+    "|".join(re.escape(n) for n in sorted(DEVICE_NAMES, key=len, reverse=True))
+)
+
+
+def match_device_name(name: str) -> bool:
+    """Return True if a device name contains any known EUC name pattern.
+
+    Matching is case-sensitive, like the substring checks it replaces, so
+    short patterns such as "C" or "P" only match capital letters.
+    """
+    return bool(name) and _DISCOVERY_RE.search(name) is not None
+
+
+class CellConfig(NamedTuple):
+    """Battery pack configuration for a series cell count."""
+    cells: int
+    max_voltage: float
+    nominal_voltage: float
+
 
 # Battery cell configurations (number of cells in series)
-CELL_CONFIG = {
-    "16S": {"cells": 16, "max_voltage": 67.2, "nominal_voltage": 59.2},
-    "20S": {"cells": 20, "max_voltage": 84.0, "nominal_voltage": 74.0},
-    "24S": {"cells": 24, "max_voltage": 100.8, "nominal_voltage": 88.8},
-    "30S": {"cells": 30, "max_voltage": 126.0, "nominal_voltage": 111.0},
-    "36S": {"cells": 36, "max_voltage": 151.2, "nominal_voltage": 133.2},
-    "42S": {"cells": 42, "max_voltage": 176.4, "nominal_voltage": 155.4},
+CELL_CONFIG: dict[str, CellConfig] = {
+    "16S": CellConfig(16, 67.2, 59.2),
+    "20S": CellConfig(20, 84.0, 74.0),
+    "24S": CellConfig(24, 100.8, 88.8),
+    "30S": CellConfig(30, 126.0, 111.0),
+    "36S": CellConfig(36, 151.2, 133.2),
+    "42S": CellConfig(42, 176.4, 155.4),
+}
+
+# Same configurations keyed by series cell count
+CELL_CONFIG_BY_CELLS: dict[int, CellConfig] = {
+    config.cells: config for config in CELL_CONFIG.values()
 }
 
 CONF_RETRY_COUNT = "retry_count"
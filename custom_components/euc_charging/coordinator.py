@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import datetime
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 from bleak import BleakClient
@@ -27,11 +29,7 @@ from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN, NOTIFY_UUID, CONF_RETRY_COUNT, DEFAULT_RETRY_COUNT,
-    KINGSONG_READ_UUID, GOTWAY_READ_UUID, VETERAN_READ_UUID,
-    INMOTION_READ_UUID, INMOTION_WRITE_UUID,
-    INMOTION_V2_READ_UUID, INMOTION_V2_WRITE_UUID,
-    NINEBOT_READ_UUID, NINEBOT_WRITE_UUID,
-    NINEBOT_Z_READ_UUID, NINEBOT_Z_WRITE_UUID,
+    BRAND_UUID_TABLE, DEFAULT_BRAND_UUIDS, DEFAULT_KEEPALIVE_INTERVAL,
     WheelBrand,
 )
 from .decoders import EucDecoder, get_decoder_by_data
@@ -42,6 +40,12 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Minimum seconds between discovery callback log lines
+DISCOVERY_LOG_INTERVAL = 10.0
+
+# Telemetry fields fed to the charge tracker, extracted in one call
+_CHARGE_KEYS = itemgetter("battery_percent", "is_charging", "voltage")
+
 
 class EucChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching EUC data."""
@@ -68,13 +72,21 @@ class EucChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._keepalive_task: asyncio.Task | None = None
         self._retry_count = entry.options.get(CONF_RETRY_COUNT, DEFAULT_RETRY_COUNT)
         self._cancel_callback: BluetoothCallback | None = None
-        self._device_available = asyncio.Event()
+        # Resolved by the discovery callback while the connect loop waits for the device
+        self._device_future: asyncio.Future[None] | None = None
         self._device_seen_recently = False
+        self._last_discovery_log = 0.0
         self._read_uuid: str | None = None
         self._write_uuid: str | None = None
         self._requires_keepalive = False
+        self._keepalive_packet: bytes | None = None
+        self._keepalive_interval = DEFAULT_KEEPALIVE_INTERVAL
         self.auto_connect_enabled = True  # Default to enabled
         self._reconnect_event = asyncio.Event()
+        self._device_entry: dr.DeviceEntry | None = None
+        self._last_model_version: tuple[str, str] | None = None
+        self._device_info_cache: dr.DeviceInfo | None = None
+        self._device_info_key: tuple[str, str, str | None, str | None] | None = None
         
         # Store last known values (persist even when disconnected)
         self.last_connected_time: datetime | None = None
@@ -83,41 +95,34 @@ class EucChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.last_trip_distance: float | None = None
         self.last_total_distance: float | None = None
 
+    def get_device_info(self) -> dr.DeviceInfo:
+        """Return shared device info, rebuilt only when its fields change."""
+        data = self.data or {}
+        model = data.get("model", "Unknown Model")
+        manufacturer = data.get("manufacturer", "Leaperkim")
+        sw_version = data.get("version")
+        name = self.ble_device.name
+        key = (model, manufacturer, sw_version, name)
+        if self._device_info_cache is None or key != self._device_info_key:
+            self._device_info_key = key
+            self._device_info_cache = dr.DeviceInfo(
+                identifiers={(DOMAIN, self.ble_device.address)},
+                name=f"{manufacturer} {model} ({name})",
+                manufacturer=manufacturer,
+                model=model,
+                sw_version=sw_version,
+            )
+        return self._device_info_cache
+
     def _setup_uuids_for_brand(self, brand: WheelBrand) -> None:
         """Set up read/write UUIDs and keepalive requirements based on brand."""
-        if brand == WheelBrand.KINGSONG:
-            self._read_uuid = KINGSONG_READ_UUID
-            self._write_uuid = None
-            self._requires_keepalive = False
-        elif brand in (WheelBrand.GOTWAY, WheelBrand.BEGODE):
-            self._read_uuid = GOTWAY_READ_UUID
-            self._write_uuid = None
-            self._requires_keepalive = False
-        elif brand in (WheelBrand.VETERAN, WheelBrand.LEAPERKIM):
-            self._read_uuid = VETERAN_READ_UUID
-            self._write_uuid = None
-            self._requires_keepalive = False
-        elif brand == WheelBrand.INMOTION:
-            self._read_uuid = INMOTION_READ_UUID
-            self._write_uuid = INMOTION_WRITE_UUID
-            self._requires_keepalive = True
-        elif brand == WheelBrand.INMOTION_V2:
-            self._read_uuid = INMOTION_V2_READ_UUID
-            self._write_uuid = INMOTION_V2_WRITE_UUID
-            self._requires_keepalive = True
-        elif brand == WheelBrand.NINEBOT:
-            self._read_uuid = NINEBOT_READ_UUID
-            self._write_uuid = NINEBOT_WRITE_UUID
-            self._requires_keepalive = True
-        elif brand == WheelBrand.NINEBOT_Z:
-            self._read_uuid = NINEBOT_Z_READ_UUID
-            self._write_uuid = NINEBOT_Z_WRITE_UUID
-            self._requires_keepalive = True
-        else:
-            # Default to Veteran/KingSong UUIDs
-            self._read_uuid = NOTIFY_UUID
-            self._write_uuid = None
-            self._requires_keepalive = False
+        # Unknown brands default to Veteran/KingSong UUIDs
+        (
+            self._read_uuid,
+            self._write_uuid,
+            self._requires_keepalive,
+            self._keepalive_interval,
+        ) = BRAND_UUID_TABLE.get(brand, DEFAULT_BRAND_UUIDS)
 
     async def _keepalive_loop(self) -> None:
         """Send keepalive messages for brands that require them."""
@@ -126,22 +131,27 @@ class EucChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         
         while True:
             try:
-                if not self.client or not self.client.is_connected:
+                client = self.client
+                decoder = self.decoder
+                if not client or not client.is_connected or not decoder:
                     await asyncio.sleep(1)
                     continue
                 
-                # Send keepalive based on decoder brand
-                if self.decoder:
-                    keepalive_data = self.decoder.get_keepalive_packet()
-                    if keepalive_data and self._write_uuid:
-                        await self.client.write_gatt_char(self._write_uuid, keepalive_data, response=False)
-                        _LOGGER.debug("Sent keepalive packet")
-                
+                # Bind per connection so the send loop avoids repeated lookups.
+                # Passing the resolved characteristic skips bleak's per-write UUID search.
+                write_fn = client.write_gatt_char
+                write_char = client.services.get_characteristic(self._write_uuid) or self._write_uuid
+                get_packet = decoder.get_keepalive_packet
                 # Keep-alive interval (25ms for InMotion, 1s for others)
-                if self.decoder and self.decoder.brand in (WheelBrand.INMOTION, WheelBrand.INMOTION_V2):
-                    await asyncio.sleep(0.025)  # 25ms
-                else:
-                    await asyncio.sleep(1.0)  # 1 second
+                interval = self._keepalive_interval
+                
+                while client.is_connected and client is self.client:
+                    # Static packets are built once at detection, encrypted ones per send
+                    keepalive_data = self._keepalive_packet or get_packet()
+                    if keepalive_data:
+                        await write_fn(write_char, keepalive_data, response=False)
+                        _LOGGER.debug("Sent keepalive packet")
+                    await asyncio.sleep(interval)
                     
             except (BleakError, asyncio.TimeoutError) as ex:
                 _LOGGER.warning("Keepalive failed: %s", ex)
@@ -168,7 +178,6 @@ class EucChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         if ble_device:
             self.ble_device = ble_device
-            self._device_available.set()
             _LOGGER.info("Device %s already available at startup", self.ble_device.address)
         
         # We don't poll, so we just start the connection loop
@@ -186,21 +195,26 @@ class EucChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self, service_info: BluetoothServiceInfoBleak, change: BluetoothChange
     ) -> None:
         """Handle Bluetooth discovery updates."""
-        # Log which source (proxy) is reporting the device
-        source = getattr(service_info, 'source', 'unknown')
-        _LOGGER.info(
-            "Bluetooth discovery callback: %s (%s), change: %s, RSSI: %s, source: %s",
-            service_info.device.name or "Unknown",
-            service_info.device.address,
-            change,
-            service_info.rssi,
-            source,
-        )
+        # Log which source (proxy) is reporting the device, rate limited since
+        # proxies can deliver several advertisements per second
+        if _LOGGER.isEnabledFor(logging.INFO):
+            now = time.monotonic()
+            if now - self._last_discovery_log >= DISCOVERY_LOG_INTERVAL:
+                self._last_discovery_log = now
+                _LOGGER.info(
+                    "Bluetooth discovery callback: %s (%s), change: %s, RSSI: %s, source: %s",
+                    service_info.device.name or "Unknown",
+                    service_info.device.address,
+                    change,
+                    service_info.rssi,
+                    getattr(service_info, 'source', 'unknown'),
+                )
         # Update the BLE device with the latest service info
         self.ble_device = service_info.device
         self._device_seen_recently = True
-        # Signal that the device is available
-        self._device_available.set()
+        # Wake the connect loop if it is waiting (later advertisements are no-ops)
+        if self._device_future is not None and not self._device_future.done():
+            self._device_future.set_result(None)
 
     async def _connect_loop(self) -> None:
         """Main connection loop."""
@@ -253,27 +267,27 @@ class EucChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 # Wait for device to be available (discovered via Bluetooth)
                 _LOGGER.debug("Waiting for device %s to be available...", self.ble_device.address)
                 
-                # Check periodically with timeout
+                # Check the registry once, then wait for the discovery callback
+                # Don't require connectable flag for ESPHome proxies
                 device_found = False
-                for attempt in range(60):  # Wait up to 5 minutes (60 * 5 seconds)
-                    # Don't require connectable flag for ESPHome proxies
-                    ble_device = async_ble_device_from_address(
-                        self.hass, self.ble_device.address, connectable=False
-                    )
-                    if ble_device:
-                        self.ble_device = ble_device
-                        device_found = True
-                        _LOGGER.debug("Device found via address lookup on attempt %d", attempt + 1)
-                        break
-                    
-                    # Also check if the discovery callback set the event
+                ble_device = async_ble_device_from_address(
+                    self.hass, self.ble_device.address, connectable=False
+                )
+                if ble_device:
+                    self.ble_device = ble_device
+                    device_found = True
+                    _LOGGER.debug("Device found via address lookup")
+                else:
+                    self._device_future = self.hass.loop.create_future()
                     try:
-                        await asyncio.wait_for(self._device_available.wait(), timeout=5.0)
+                        # Wait up to 5 minutes for an advertisement
+                        await asyncio.wait_for(self._device_future, timeout=300.0)
                         device_found = True
-                        _LOGGER.debug("Device found via discovery callback on attempt %d", attempt + 1)
-                        break
+                        _LOGGER.debug("Device found via discovery callback")
                     except asyncio.TimeoutError:
-                        continue
+                        pass
+                    finally:
+                        self._device_future = None
                 
                 if not device_found:
                     _LOGGER.warning(
@@ -317,9 +331,6 @@ class EucChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     )
                     _LOGGER.info("Started keepalive task for bidirectional protocol")
                 
-                # Clear the device available event after successful connection
-                self._device_available.clear()
-                
                 # Keep the loop running while connected
                 while self.client and self.client.is_connected:
                     await asyncio.sleep(1)
@@ -374,8 +385,6 @@ class EucChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self.last_connected_time.isoformat() if self.last_connected_time else "None"
         )
         
-        # Clear the device available event so we wait for it to be rediscovered
-        self._device_available.clear()
         self._device_seen_recently = False
         
         # Clear data so sensors become unavailable (except "last_*" sensors which persist)
@@ -387,20 +396,25 @@ class EucChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def _notification_handler(self, characteristic: Any, data: bytearray) -> None:
         """Handle BLE notifications."""
         try:
-            byte_data = bytes(data)
+            # Decoders copy into their own frame buffers, so a zero-copy view suffices
+            view = memoryview(data)
             
             # Auto-detect protocol if not yet established
             if not self.decoder:
-                self.decoder = get_decoder_by_data(byte_data)
+                self.decoder = get_decoder_by_data(view)
                 if self.decoder:
-                    _LOGGER.info("Protocol detected: %s (brand: %s)", self.decoder.name, self.decoder.brand)
+                    _LOGGER.info("Protocol detected: %s (brand: %s)", self.decoder.name, self.decoder.brand.str_value)
                     # Setup UUIDs for this brand
                     self._setup_uuids_for_brand(self.decoder.brand)
+                    self._keepalive_packet = (
+                        self.decoder.get_keepalive_packet()
+                        if self.decoder.static_keepalive else None
+                    )
                 else:
                     # Buffer is too short or unknown header
                     return
 
-            telemetry = self.decoder.decode(byte_data)
+            telemetry = self.decoder.decode(view)
             if telemetry:
                 # Update last connected time and store last known values
                 self.last_connected_time = dt_util.now()
@@ -410,12 +424,15 @@ class EucChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self.last_total_distance = telemetry.get("total_distance")
                 
                 # Add charge estimates with voltage data
-                estimates = self.charge_tracker.update(
-                    telemetry.get("battery_percent", 0),
-                    telemetry.get("is_charging", False),
-                    telemetry.get("voltage", 0)
-                )
-                telemetry["charge_estimates"] = estimates
+                try:
+                    battery_percent, is_charging, voltage = _CHARGE_KEYS(telemetry)
+                except KeyError:
+                    battery_percent = telemetry.get("battery_percent", 0)
+                    is_charging = telemetry.get("is_charging", False)
+                    voltage = telemetry.get("voltage", 0)
+                estimates = self.charge_tracker.update(battery_percent, is_charging, voltage)
+                # No estimates while not charging, so sensors need only one lookup to bail out
+                telemetry["charge_estimates"] = estimates if is_charging else None
                 
                 # Add last connected time to telemetry
                 telemetry["last_connected_time"] = self.last_connected_time
@@ -423,21 +440,27 @@ class EucChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self.async_set_updated_data(telemetry)
                 
                 # Update device registry if needed (e.g. on first packet with model info)
-                if self.ble_device and telemetry.get("model") and telemetry.get("version"):
+                # Only touch the registry when model/version differ from what was last applied
+                model = telemetry.get("model")
+                version = telemetry.get("version")
+                if self.ble_device and model and version and (model, version) != self._last_model_version:
                     device_registry = dr.async_get(self.hass)
-                    device_entry = device_registry.async_get_device(
-                        identifiers={(DOMAIN, self.ble_device.address)}
-                    )
-                    if device_entry and (
-                        device_entry.model != telemetry["model"] or 
-                        device_entry.sw_version != telemetry["version"]
-                    ):
-                        device_registry.async_update_device(
-                            device_entry.id,
-                            model=telemetry["model"],
-                            manufacturer=telemetry.get("manufacturer", "Leaperkim"),
-                            sw_version=telemetry["version"],
+                    if self._device_entry is None:
+                        self._device_entry = device_registry.async_get_device(
+                            identifiers={(DOMAIN, self.ble_device.address)}
                         )
+                    if self._device_entry:
+                        self._last_model_version = (model, version)
+                        if (
+                            self._device_entry.model != model or 
+                            self._device_entry.sw_version != version
+                        ):
+                            self._device_entry = device_registry.async_update_device(
+                                self._device_entry.id,
+                                model=model,
+                                manufacturer=telemetry.get("manufacturer", "Leaperkim"),
+                                sw_version=version,
+                            )
 
         except Exception as ex:
             _LOGGER.error("Error decoding packet: %s", ex)
@@ -11,18 +11,154 @@ Supports automatic protocol detection for all major EUC brands:
 from __future__ import annotations
 
 import logging
+import re
 import struct
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from enum import Enum
-from typing import Any, Optional
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from math import floor
+from typing import Any, Callable, Iterable, Optional
 
-from .const import CELL_CONFIG, WheelBrand
+from .const import CELL_CONFIG, CellConfig, WheelBrand
 
 _LOGGER = logging.getLogger(__name__)
 
-
-@dataclass
+# Precompiled field formats shared by the decoders (avoids per-call format lookup)
+_U16_BE = struct.Struct(">H")
+_U16_LE = struct.Struct("<H")
+
+# System voltage auto-detection tables: a measured voltage strictly above
+# THRESHOLDS[i - 1] and at or below THRESHOLDS[i] maps to VOLTAGES[i],
+# i.e. VOLTAGES[bisect_left(THRESHOLDS, voltage)]
+_KS_THRESHOLDS = (75.0, 90.0, 115.0, 140.0, 165.0)
+_KS_VOLTAGES = (67.2, 84.0, 100.8, 126.0, 151.2, 176.4)  # 16S..42S
+_GW_THRESHOLDS = (75.0, 90.0, 115.0, 140.0)
+_GW_VOLTAGES = (67.2, 84.0, 100.8, 126.0, 151.2)  # 16S..36S
+_AUTO_THRESHOLDS = (75.0, 95.0, 115.0, 140.0, 150.0)
+_AUTO_VOLTAGES = (67.2, 84.0, 100.8, 126.0, 151.2, 176.4)  # 16S..42S, InMotion and Ninebot
+
+# Cell configurations keyed by every whole volt a system voltage within 1V of
+# their max voltage can floor to (the packs are far enough apart not to collide)
+_CELL_CONFIG_BY_VOLT: dict[int, CellConfig] = {
+    volt: config
+    for config in CELL_CONFIG.values()
+    for volt in range(floor(config.max_voltage - 1.0), floor(config.max_voltage + 1.0) + 1)
+}
+
+
+def _better_percent(voltage_raw: int, max_voltage_raw: int, cells: int) -> float:
+    """Non-linear battery percentage from centivolt readings.
+    
+    Based on WheelLog's "better percents" algorithm. Only used to build the
+    per-pack lookup tables below.
+    """
+    # Thresholds (in centivolts)
+    full_threshold = max_voltage_raw - (cells * 6)  # 4.14V per cell
+    upper_threshold = cells * 340  # 3.40V per cell
+    lower_threshold = cells * 331  # 3.31V per cell
+    
+    if voltage_raw >= full_threshold:
+        return 100.0
+    elif voltage_raw > upper_threshold:
+        # Linear interpolation between 3.40V and full
+        range_v = full_threshold - upper_threshold
+        current_v = voltage_raw - upper_threshold
+        return round((current_v / range_v) * 100.0, 1)
+    elif voltage_raw > lower_threshold:
+        # Slower discharge region
+        range_v = upper_threshold - lower_threshold
+        current_v = voltage_raw - lower_threshold
+        return round((current_v / range_v) * 20.0, 1)  # Only 20% in this region
+    else:
+        return 0.0
+
+
+def _build_better_percent_lut(config: CellConfig) -> tuple[int, int, array]:
+    """Tabulate _better_percent for every centivolt strictly between 0% and 100%.
+    
+    Returns (empty_raw, full_raw, lut): readings at or below empty_raw are 0%,
+    at or above full_raw are 100%, and lut[voltage_raw - empty_raw] otherwise.
+    """
+    max_voltage_raw = int(config.max_voltage * 100)
+    empty_raw = config.cells * 331  # 3.31V per cell
+    full_raw = max_voltage_raw - (config.cells * 6)  # 4.14V per cell
+    lut = array(
+        "d",
+        (_better_percent(raw, max_voltage_raw, config.cells) for raw in range(empty_raw, full_raw)),
+    )
+    return empty_raw, full_raw, lut
+
+
+# Better-percent tables keyed by series cell count (8 bytes per centivolt, ~16 KB for 24S)
+_BETTER_PERCENT_LUTS: dict[int, tuple[int, int, array]] = {
+    config.cells: _build_better_percent_lut(config) for config in CELL_CONFIG.values()
+}
+
+
+@lru_cache(maxsize=8192)
+def _battery_percent(
+    voltage: float, 
+    system_voltage: float,
+    use_better_percents: bool = True
+) -> float:
+    """Calculate battery percentage based on voltage and system configuration.
+    
+    Pure in its arguments, so results are cached: decoded voltages are
+    centivolt steps and rarely change between consecutive packets.
+    
+    Args:
+        voltage: Current battery voltage
+        system_voltage: Max/nominal system voltage (e.g., 100.8 for 24S)
+        use_better_percents: Use non-linear curve for more accurate readings
+    """
+    if system_voltage <= 0:
+        return 0.0
+    
+    # Determine cell configuration
+    cell_config = _CELL_CONFIG_BY_VOLT.get(floor(system_voltage))
+    if cell_config is not None and abs(system_voltage - cell_config.max_voltage) >= 1.0:
+        cell_config = None
+    
+    if not cell_config:
+        # Fallback to simple linear calculation
+        return max(0.0, min(100.0, (voltage / system_voltage) * 100.0))
+    
+    if not use_better_percents:
+        # Simple linear calculation
+        max_v = cell_config.max_voltage
+        min_v = cell_config.cells * 3.0  # 3.0V per cell is considered empty
+        return max(0.0, min(100.0, ((voltage - min_v) / (max_v - min_v)) * 100.0))
+    
+    # Better non-linear calculation based on Li-ion discharge curve (tabulated)
+    empty_raw, full_raw, lut = _BETTER_PERCENT_LUTS[cell_config.cells]
+    voltage_raw = int(voltage * 100)
+    if voltage_raw >= full_raw:
+        return 100.0
+    if voltage_raw <= empty_raw:
+        return 0.0
+    return lut[voltage_raw - empty_raw]
+
+
+def _xor_bytes(data: bytes) -> int:
+    """Return the XOR of all bytes in data.
+    
+    Reads data as one integer and folds its high half onto its low half until a
+    single byte is left, so the work is a few C-level integer ops, not a byte loop.
+    """
+    if not data:
+        return 0
+    value = int.from_bytes(data, "little")
+    # Width rounded up to a power of two; the zero padding doesn't change the XOR
+    bits = 8 << (len(data) - 1).bit_length()
+    while bits > 8:
+        bits >>= 1
+        value = (value >> bits) ^ (value & ((1 << bits) - 1))
+    return value
+
+
+@dataclass(slots=True)
 class EucTelemetry:
     """Common telemetry data for all EUCs."""
     voltage: float = 0.0          # Volts
@@ -42,21 +178,53 @@ class EucTelemetry:
     system_voltage: float = 0.0   # Nominal/Max voltage (e.g. 100.8V)
     pwm: float = 0.0              # PWM percentage
     battery_current: float = 0.0  # Battery current (for BMS-equipped wheels)
+
+    @classmethod
+    def from_result(cls, result: dict[str, Any]) -> EucTelemetry:
+        """Build telemetry from a decoded result, ignoring protocol-specific keys."""
+        return cls(**{key: value for key, value in result.items() if key in _TELEMETRY_FIELDS})
+
+
+_TELEMETRY_FIELDS = frozenset(field.name for field in fields(EucTelemetry))
     
 
 class EucDecoder(ABC):
     """Base class for EUC protocol decoders."""
 
+    # False when get_keepalive_packet() differs between calls (e.g. rolling encryption)
+    static_keepalive = True
+
     def __init__(self) -> None:
-        self.last_telemetry = EucTelemetry()
+        # Decoders only store their latest result; last_telemetry is built from it on demand
+        self._last_result: Optional[dict[str, Any]] = None
+        self._telemetry = EucTelemetry()
+        self._telemetry_source: Optional[dict[str, Any]] = None
         self.packet_count = 0
         self.error_count = 0
 
+    @property
+    def last_telemetry(self) -> EucTelemetry:
+        """Return telemetry from the most recently decoded frame."""
+        result = self._last_result
+        if result is not self._telemetry_source:
+            self._telemetry = EucTelemetry.from_result(result)
+            self._telemetry_source = result
+        return self._telemetry
+
     @abstractmethod
     def decode(self, data: bytes) -> Optional[dict[str, Any]]:
         """Decode a packet and return dictionary of values if complete frame."""
         pass
 
+    def decode_batch(self, chunks: Iterable[bytes]) -> Optional[dict[str, Any]]:
+        """Decode several buffered notifications in a single pass.
+        
+        The chunks are joined and handed to the unpacker at once, so frames split
+        across notifications are assembled in one scan. Like decode(), returns the
+        values from the last complete frame, or None.
+        """
+        return self.decode(b"".join(chunks))
+
     def get_keepalive_packet(self) -> Optional[bytes]:
         """Return keepalive packet for bidirectional protocols (InMotion, Ninebot).
         
@@ -74,72 +242,8 @@ class EucDecoder(ABC):
         """Return the brand this decoder supports."""
         return WheelBrand.UNKNOWN
 
-    def calculate_battery_percent(
-        self, 
-        voltage: float, 
-        system_voltage: float,
-        use_better_percents: bool = True
-    ) -> float:
-        """Calculate battery percentage based on voltage and system configuration.
-        
-        Args:
-            voltage: Current battery voltage
-            system_voltage: Max/nominal system voltage (e.g., 100.8 for 24S)
-            use_better_percents: Use non-linear curve for more accurate readings
-        """
-        if system_voltage <= 0:
-            return 0.0
-        
-        # Determine cell configuration
-        cell_config = None
-        for config_name, config in CELL_CONFIG.items():
-            if abs(system_voltage - config["max_voltage"]) < 1.0:
-                cell_config = config
-                break
-        
-        if not cell_config:
-            # Fallback to simple linear calculation
-            return max(0.0, min(100.0, (voltage / system_voltage) * 100.0))
-        
-        if not use_better_percents:
-            # Simple linear calculation
-            max_v = cell_config["max_voltage"]
-            min_v = cell_config["cells"] * 3.0  # 3.0V per cell is considered empty
-            return max(0.0, min(100.0, ((voltage - min_v) / (max_v - min_v)) * 100.0))
-        
-        # Better non-linear calculation based on Li-ion discharge curve
-        # Based on WheelLog's "better percents" algorithm
-        voltage_raw = int(voltage * 100)
-        max_voltage_raw = int(cell_config["max_voltage"] * 100)
-        cells = cell_config["cells"]
-        
-        # Thresholds (in centivolts)
-        full_threshold = max_voltage_raw - (cells * 6)  # 4.14V per cell
-        upper_threshold = cells * 340  # 3.40V per cell
-        lower_threshold = cells * 331  # 3.31V per cell
-        
-        if voltage_raw >= full_threshold:
-            return 100.0
-        elif voltage_raw > upper_threshold:
-            # Linear interpolation between 3.40V and full
-            range_v = full_threshold - upper_threshold
-            current_v = voltage_raw - upper_threshold
-            return round((current_v / range_v) * 100.0, 1)
-        elif voltage_raw > lower_threshold:
-            # Slower discharge region
-            range_v = upper_threshold - lower_threshold
-            current_v = voltage_raw - lower_threshold
-            return round((current_v / range_v) * 20.0, 1)  # Only 20% in this region
-        else:
-            return 0.0
-
-
-class UnpackerState(Enum):
-    """State of the protocol unpacker."""
-    UNKNOWN = 0
-    LENSEARCH = 1
-    COLLECTING = 2
-    DONE = 3
+    # Stateless, so shared as a plain function (no bound method per call)
+    calculate_battery_percent = staticmethod(_battery_percent)
 
 
 class VeteranUnpacker:
@@ -148,71 +252,68 @@ class VeteranUnpacker:
     Frame format: DC 5A 5C [len] [data...]
     """
 
+    HEADER = bytes([0xDC, 0x5A, 0x5C])
+
     def __init__(self) -> None:
         """Initialize the unpacker."""
+        # Unconsumed bytes carried over between packets
         self.buffer = bytearray()
-        self.old1 = 0
-        self.old2 = 0
-        self.length = 0
-        self.state = UnpackerState.UNKNOWN
 
     def reset(self) -> None:
         """Reset unpacker state."""
-        self.old1 = 0
-        self.old2 = 0
-        self.state = UnpackerState.UNKNOWN
-
-    def get_buffer(self) -> bytes:
-        """Return the accumulated buffer."""
-        return bytes(self.buffer)
-
-    def add_char(self, c: int) -> bool:
-        """Add a byte to the unpacker. Returns True when a complete frame is ready."""
-        if self.state == UnpackerState.COLLECTING:
-            bsize = len(self.buffer)
-
-            # Validation checks from WheelLog
-            if ((bsize == 22 and c != 0x00) or
-                (bsize == 30 and c not in (0x00, 0x07)) or
-                (bsize == 23 and (c & 0xFE) != 0x00)):
-                self.state = UnpackerState.DONE
-                self.reset()
-                return False
-
-            self.buffer.append(c)
-
-            if bsize == self.length + 3:
-                self.state = UnpackerState.DONE
-                self.reset()
-                return True
-
-        elif self.state == UnpackerState.LENSEARCH:
-            self.buffer.append(c)
-            self.length = c & 0xFF
-            self.state = UnpackerState.COLLECTING
-            self.old2 = self.old1
-            self.old1 = c
-
-        else:  # UNKNOWN state
-            # Looking for DC 5A 5C header sequence
-            if c == 0x5C and self.old1 == 0x5A and self.old2 == 0xDC:
-                self.buffer = bytearray([0xDC, 0x5A, 0x5C])
-                self.state = UnpackerState.LENSEARCH
-            elif c == 0x5A and self.old1 == 0xDC:
-                self.old2 = self.old1
-            else:
-                self.old2 = 0
-
-            self.old1 = c
-
-        return False
+        self.buffer.clear()
+
+    @staticmethod
+    def _find_invalid_byte(buffer: bytearray, start: int, frame_len: int) -> int:
+        """Return the frame offset of the first byte failing validation, or -1.
+        
+        Validation checks from WheelLog. Bytes that haven't arrived yet pass.
+        """
+        available = len(buffer) - start
+        if frame_len > 22 and available > 22 and buffer[start + 22] != 0x00:
+            return 22
+        if frame_len > 23 and available > 23 and (buffer[start + 23] & 0xFE) != 0x00:
+            return 23
+        if frame_len > 30 and available > 30 and buffer[start + 30] not in (0x00, 0x07):
+            return 30
+        return -1
 
     def add_data(self, data: bytes) -> list[bytes]:
         """Add multiple bytes and return any complete frames."""
+        buffer = self.buffer
+        buffer.extend(data)
         frames = []
-        for byte in data:
-            if self.add_char(byte):
-                frames.append(self.get_buffer())
+        
+        pos = 0
+        # Frames are copied out through a view: one copy instead of slice + bytes()
+        with memoryview(buffer) as view:
+            while True:
+                start = buffer.find(self.HEADER, pos)
+                if start < 0:
+                    # Keep the tail, it may hold the start of a header split across packets
+                    pos = max(len(buffer) - 2, pos)
+                    break
+                if start + 4 > len(buffer):
+                    # Wait for the length byte
+                    pos = start
+                    break
+            
+                frame_len = buffer[start + 3] + 4
+                invalid = self._find_invalid_byte(buffer, start, frame_len)
+                if invalid >= 0:
+                    # Drop the frame up to and including the bad byte, then resync
+                    pos = start + invalid + 1
+                    continue
+            
+                end = start + frame_len
+                if end > len(buffer):
+                    # Wait for the rest of the frame
+                    pos = start
+                    break
+                frames.append(view[start:end].tobytes())
+                pos = end
+        
+        del buffer[:pos]
         return frames
 
 
@@ -232,28 +333,36 @@ class KingSongUnpacker:
 
     def add_data(self, data: bytes) -> list[bytes]:
         """Add data and return complete frames."""
-        self.buffer.extend(data)
+        buffer = self.buffer
+        buffer.extend(data)
         frames = []
-        
-        while len(self.buffer) >= self.FRAME_SIZE:
-            # Look for header
-            if self.buffer[:2] == self.HEADER:
-                if len(self.buffer) >= self.FRAME_SIZE:
-                    frame = bytes(self.buffer[:self.FRAME_SIZE])
-                    # Verify footer
-                    if frame[-4:] == self.FOOTER:
-                        frames.append(frame)
-                        self.buffer = self.buffer[self.FRAME_SIZE:]
-                    else:
-                        # Invalid frame, skip header
-                        self.buffer = self.buffer[2:]
-                else:
+        frame_size = self.FRAME_SIZE
+        
+        # Scan with a read cursor and drop the consumed prefix once at the end,
+        # instead of re-slicing the buffer for every skipped byte
+        pos = 0
+        with memoryview(buffer) as view:
+            while True:
+                # Look for header (C-level search skips noise in one call)
+                header_pos = buffer.find(self.HEADER, pos)
+                if header_pos < 0:
+                    # Keep the last byte, it may be the first half of a split header
+                    pos = max(len(buffer) - 1, pos)
+                    break
+                pos = header_pos
+                end = pos + frame_size
+                if end > len(buffer):
                     # Wait for more data
                     break
-            else:
-                # Skip one byte and keep looking
-                self.buffer = self.buffer[1:]
+                # Verify footer
+                if buffer[end - 4:end] == self.FOOTER:
+                    frames.append(view[pos:end].tobytes())
+                    pos = end
+                else:
+                    # Invalid frame, skip header
+                    pos += 2
         
+        del buffer[:pos]
         return frames
 
 
@@ -273,28 +382,36 @@ class GotwayUnpacker:
 
     def add_data(self, data: bytes) -> list[bytes]:
         """Add data and return complete frames."""
-        self.buffer.extend(data)
+        buffer = self.buffer
+        buffer.extend(data)
         frames = []
-        
-        while len(self.buffer) >= self.FRAME_SIZE:
-            # Look for header
-            if self.buffer[:2] == self.HEADER:
-                if len(self.buffer) >= self.FRAME_SIZE:
-                    frame = bytes(self.buffer[:self.FRAME_SIZE])
-                    # Verify footer
-                    if frame[-4:] == self.FOOTER:
-                        frames.append(frame)
-                        self.buffer = self.buffer[self.FRAME_SIZE:]
-                    else:
-                        # Invalid frame, skip header
-                        self.buffer = self.buffer[2:]
-                else:
+        frame_size = self.FRAME_SIZE
+        
+        # Scan with a read cursor and drop the consumed prefix once at the end,
+        # instead of re-slicing the buffer for every skipped byte
+        pos = 0
+        with memoryview(buffer) as view:
+            while True:
+                # Look for header (C-level search skips noise in one call)
+                header_pos = buffer.find(self.HEADER, pos)
+                if header_pos < 0:
+                    # Keep the last byte, it may be the first half of a split header
+                    pos = max(len(buffer) - 1, pos)
+                    break
+                pos = header_pos
+                end = pos + frame_size
+                if end > len(buffer):
                     # Wait for more data
                     break
-            else:
-                # Skip one byte and keep looking
-                self.buffer = self.buffer[1:]
+                # Verify footer
+                if buffer[end - 4:end] == self.FOOTER:
+                    frames.append(view[pos:end].tobytes())
+                    pos = end
+                else:
+                    # Invalid frame, skip header
+                    pos += 2
         
+        del buffer[:pos]
         return frames
 
 
@@ -319,6 +436,13 @@ class VeteranDecoder(EucDecoder):
         43: "Nosfet Aero",
     }
 
+    # Live frame fields from offset 4: voltage, speed, trip (low, high word),
+    # total (low, high word), current, temperature, auto-off, charge mode.
+    # Distances are 32-bit "reversed big-endian": two BE words, low word first.
+    _LIVE_FRAME = struct.Struct(">HhHHHHhhHH")
+    # Firmware version at offset 28 and pitch angle at 32 (frames are at least 36 bytes)
+    _VERSION_PITCH = struct.Struct(">H2xh")
+
     # Voltage configurations by model
     VOLTAGE_MAP = {
         "Sherman": 100.8,      # 24S
@@ -337,7 +461,10 @@ class VeteranDecoder(EucDecoder):
         super().__init__()
         self.unpacker = VeteranUnpacker()
         self.model_version = 0
-        self.detected_model = "Sherman S"  # Default
+        self._set_model("Sherman S")  # Default
+        # Raw firmware version and its formatted string, reformatted only on change
+        self._version_raw: Optional[int] = None
+        self._version_str = ""
 
     @property
     def brand(self) -> WheelBrand:
@@ -365,56 +492,39 @@ class VeteranDecoder(EucDecoder):
             return None
 
         try:
-            voltage = struct.unpack(">H", buff[4:6])[0] / 100.0
-            speed = (struct.unpack(">h", buff[6:8])[0] * 10) / 1000.0
-            distance = self._int_from_bytes_rev_be(buff, 8) / 1000.0
-            total_distance = self._int_from_bytes_rev_be(buff, 12) / 1000.0
-            current = (struct.unpack(">h", buff[16:18])[0] * 10) / 1000.0
-            temperature = struct.unpack(">h", buff[18:20])[0] / 100.0
-            
-            # Other fields
-            auto_off_sec = struct.unpack(">H", buff[20:22])[0]
-            charge_mode = struct.unpack(">H", buff[22:24])[0]
+            (
+                voltage_raw, speed_raw, trip_low, trip_high, total_low, total_high,
+                current_raw, temperature_raw, auto_off_sec, charge_mode,
+            ) = self._LIVE_FRAME.unpack_from(buff, 4)
+            voltage = voltage_raw / 100.0
+            speed = (speed_raw * 10) / 1000.0
+            distance = ((trip_high << 16) | trip_low) / 1000.0
+            total_distance = ((total_high << 16) | total_low) / 1000.0
+            current = (current_raw * 10) / 1000.0
+            temperature = temperature_raw / 100.0
             
             # Version and model detection
-            ver = struct.unpack(">H", buff[28:30])[0]
-            version_str = f"{ver // 1000:03d}.{(ver % 1000) // 100}.{ver % 100:02d}"
-            model_ver = ver // 1000
-            
-            # Detect model
-            if model_ver != self.model_version:
-                self.model_version = model_ver
-                self.detected_model = self.MODEL_MAP.get(model_ver, "Sherman S")
+            ver, pitch_raw = self._VERSION_PITCH.unpack_from(buff, 28)
+            if ver != self._version_raw:
+                self._version_raw = ver
+                self._version_str = f"{ver // 1000:03d}.{(ver % 1000) // 100}.{ver % 100:02d}"
+                model_ver = ver // 1000
+                
+                # Detect model
+                if model_ver != self.model_version:
+                    self.model_version = model_ver
+                    self._set_model(self.MODEL_MAP.get(model_ver, "Sherman S"))
             
-            model = self.detected_model
-            system_voltage = self.VOLTAGE_MAP.get(model, 100.8)
+            system_voltage = self.system_voltage
             
-            # Pitch angle (if available)
-            pitch_angle = 0.0
-            if len(buff) >= 34:
-                pitch_angle = struct.unpack(">h", buff[32:34])[0] / 100.0
+            pitch_angle = pitch_raw / 100.0
             
             battery_percent = self.calculate_battery_percent(voltage, system_voltage)
             is_charging = charge_mode > 0
 
             self.packet_count += 1
-            
-            self.last_telemetry.voltage = voltage
-            self.last_telemetry.speed = speed
-            self.last_telemetry.trip_distance = distance
-            self.last_telemetry.total_distance = total_distance
-            self.last_telemetry.current = current
-            self.last_telemetry.temperature = temperature
-            self.last_telemetry.battery_percent = battery_percent
-            self.last_telemetry.is_charging = is_charging
-            self.last_telemetry.charge_mode = charge_mode
-            self.last_telemetry.version = version_str
-            self.last_telemetry.model = model
-            self.last_telemetry.manufacturer = "Leaperkim" if model.startswith("Sherman") else "Veteran"
-            self.last_telemetry.system_voltage = system_voltage
-            self.last_telemetry.pitch_angle = pitch_angle
-
-            return {
+
+            self._last_result = result = {
                 "voltage": voltage,
                 "speed": speed,
                 "trip_distance": distance,
@@ -424,24 +534,25 @@ class VeteranDecoder(EucDecoder):
                 "battery_percent": battery_percent,
                 "is_charging": is_charging,
                 "charge_mode": charge_mode,
-                "version": version_str,
-                "model": model,
-                "manufacturer": self.last_telemetry.manufacturer,
+                "version": self._version_str,
+                "model": self.detected_model,
+                "manufacturer": self.manufacturer,
                 "system_voltage": system_voltage,
                 "auto_off_sec": auto_off_sec,
                 "pitch_angle": pitch_angle,
             }
+            return result
 
         except (struct.error, IndexError) as e:
             _LOGGER.debug(f"Veteran decode error: {e}")
             self.error_count += 1
             return None
 
-    def _int_from_bytes_rev_be(self, data: bytes, offset: int) -> int:
-        """Read a 32-bit integer in 'reversed big-endian' format."""
-        low = struct.unpack(">H", data[offset:offset+2])[0]
-        high = struct.unpack(">H", data[offset+2:offset+4])[0]
-        return (high << 16) | low
+    def _set_model(self, model: str) -> None:
+        """Record the detected model and the values that only depend on it."""
+        self.detected_model = model
+        self.system_voltage = self.VOLTAGE_MAP.get(model, 100.8)
+        self.manufacturer = "Leaperkim" if model.startswith("Sherman") else "Veteran"
 
 
 class KingSongDecoder(EucDecoder):
@@ -450,6 +561,9 @@ class KingSongDecoder(EucDecoder):
     Supports all KingSong models with automatic voltage detection.
     """
 
+    # Live frame fields from offset 2: voltage, speed, total distance, current, temperature
+    _LIVE_FRAME = struct.Struct(">HHIhh")
+
     def __init__(self) -> None:
         super().__init__()
         self.unpacker = KingSongUnpacker()
@@ -476,44 +590,33 @@ class KingSongDecoder(EucDecoder):
         return result
 
     def _decode_frame(self, buff: bytes) -> Optional[dict[str, Any]]:
-        """Decode a complete frame."""
-        if len(buff) < 20:
-            self.error_count += 1
-            return None
-
+        """Decode a complete frame (the unpacker only emits FRAME_SIZE-byte frames)."""
         try:
-            frame_type = buff[18] if len(buff) > 18 else 0
+            frame_type = buff[18]
             
             # Live data frame (0xA9)
             if frame_type == 0xA9:
-                voltage = struct.unpack(">H", buff[2:4])[0] / 100.0
-                speed = struct.unpack(">H", buff[4:6])[0] * 3.6  # Convert to km/h
-                total_distance = struct.unpack(">I", buff[6:10])[0] / 1000.0
-                current = struct.unpack(">h", buff[10:12])[0] / 100.0
-                temperature = struct.unpack(">h", buff[12:14])[0] / 340.0 + 36.53  # MPU6050 formula
+                (
+                    voltage_raw, speed_raw, total_raw, current_raw, temperature_raw,
+                ) = self._LIVE_FRAME.unpack_from(buff, 2)
+                voltage = voltage_raw / 100.0
+                speed = speed_raw * 3.6  # Convert to km/h
+                total_distance = total_raw / 1000.0
+                current = current_raw / 100.0
+                temperature = temperature_raw / 340.0 + 36.53  # MPU6050 formula
                 
                 # Auto-detect system voltage
                 self._detect_voltage(voltage)
                 
-                battery_percent = self.calculate_battery_percent(voltage, self.system_voltage)
+                system_voltage = self.system_voltage
+                battery_percent = self.calculate_battery_percent(voltage, system_voltage)
                 
                 # KingSong doesn't directly report charging, infer from current
                 is_charging = current < -0.5  # Negative current = charging
                 
                 self.packet_count += 1
-                
-                self.last_telemetry.voltage = voltage
-                self.last_telemetry.speed = speed
-                self.last_telemetry.total_distance = total_distance
-                self.last_telemetry.current = current
-                self.last_telemetry.temperature = temperature
-                self.last_telemetry.battery_percent = battery_percent
-                self.last_telemetry.is_charging = is_charging
-                self.last_telemetry.model = self.model_name
-                self.last_telemetry.manufacturer = "KingSong"
-                self.last_telemetry.system_voltage = self.system_voltage
-
-                return {
+
+                self._last_result = result = {
                     "voltage": voltage,
                     "speed": speed,
                     "total_distance": total_distance,
@@ -523,8 +626,9 @@ class KingSongDecoder(EucDecoder):
                     "is_charging": is_charging,
                     "model": self.model_name,
                     "manufacturer": "KingSong",
-                    "system_voltage": self.system_voltage,
+                    "system_voltage": system_voltage,
                 }
+                return result
             
             # Model/Name frame (0xBB) - could parse model name here
             elif frame_type == 0xBB:
@@ -540,21 +644,7 @@ class KingSongDecoder(EucDecoder):
 
     def _detect_voltage(self, voltage: float) -> None:
         """Auto-detect system voltage based on measured voltage."""
-        # Check against known configurations
-        if voltage > 90.0:
-            if voltage > 140.0:
-                if voltage > 165.0:
-                    self.system_voltage = 176.4  # 42S
-                else:
-                    self.system_voltage = 151.2  # 36S
-            elif voltage > 115.0:
-                self.system_voltage = 126.0  # 30S
-            else:
-                self.system_voltage = 100.8  # 24S
-        elif voltage > 75.0:
-            self.system_voltage = 84.0  # 20S
-        else:
-            self.system_voltage = 67.2  # 16S
+        self.system_voltage = _KS_VOLTAGES[bisect_left(_KS_THRESHOLDS, voltage)]
 
 
 class GotwayDecoder(EucDecoder):
@@ -563,6 +653,11 @@ class GotwayDecoder(EucDecoder):
     Supports all Gotway/Begode models with automatic voltage detection.
     """
 
+    # Live frame fields from offset 2: voltage, speed, (2 skipped), total distance
+    _LIVE_HEAD = struct.Struct(">Hh2xI")
+    # From offset 10: current, temperature, PWM (current overlaps the distance word)
+    _LIVE_TAIL = struct.Struct(">hhh")
+
     def __init__(self) -> None:
         super().__init__()
         self.unpacker = GotwayUnpacker()
@@ -589,50 +684,37 @@ class GotwayDecoder(EucDecoder):
         return result
 
     def _decode_frame(self, buff: bytes) -> Optional[dict[str, Any]]:
-        """Decode a complete frame."""
-        if len(buff) < 20:
-            self.error_count += 1
-            return None
-
+        """Decode a complete frame (the unpacker only emits FRAME_SIZE-byte frames)."""
         try:
-            frame_type = buff[18] if len(buff) > 18 else 0
+            frame_type = buff[18]
             
             # Live data frame (0x00)
             if frame_type == 0x00:
-                voltage = struct.unpack(">H", buff[2:4])[0] / 100.0
-                speed = struct.unpack(">h", buff[4:6])[0] * 3.6 * 0.875  # Apply scaler
-                current = struct.unpack(">h", buff[10:12])[0] / 100.0
-                temperature = struct.unpack(">h", buff[12:14])[0] / 340.0 + 36.53  # MPU6050
+                voltage_raw, speed_raw, total_raw = self._LIVE_HEAD.unpack_from(buff, 2)
+                current_raw, temperature_raw, pwm_raw = self._LIVE_TAIL.unpack_from(buff, 10)
+                voltage = voltage_raw / 100.0
+                speed = speed_raw * 3.6 * 0.875  # Apply scaler
+                current = current_raw / 100.0
+                temperature = temperature_raw / 340.0 + 36.53  # MPU6050
                 
                 # Distance varies by firmware
-                total_distance = struct.unpack(">I", buff[8:12])[0] * 0.875 / 1000.0
+                total_distance = total_raw * 0.875 / 1000.0
                 
                 # PWM
-                pwm = abs(struct.unpack(">h", buff[14:16])[0]) / 10.0
+                pwm = abs(pwm_raw) / 10.0
                 
                 # Auto-detect system voltage
                 self._detect_voltage(voltage)
                 
-                battery_percent = self.calculate_battery_percent(voltage, self.system_voltage)
+                system_voltage = self.system_voltage
+                battery_percent = self.calculate_battery_percent(voltage, system_voltage)
                 
                 # Infer charging from current
                 is_charging = current < -0.5
                 
                 self.packet_count += 1
-                
-                self.last_telemetry.voltage = voltage
-                self.last_telemetry.speed = speed
-                self.last_telemetry.total_distance = total_distance
-                self.last_telemetry.current = current
-                self.last_telemetry.temperature = temperature
-                self.last_telemetry.battery_percent = battery_percent
-                self.last_telemetry.is_charging = is_charging
-                self.last_telemetry.pwm = pwm
-                self.last_telemetry.model = self.model_name
-                self.last_telemetry.manufacturer = "Begode"
-                self.last_telemetry.system_voltage = self.system_voltage
-
-                return {
+
+                self._last_result = result = {
                     "voltage": voltage,
                     "speed": speed,
                     "total_distance": total_distance,
@@ -643,8 +725,9 @@ class GotwayDecoder(EucDecoder):
                     "pwm": pwm,
                     "model": self.model_name,
                     "manufacturer": "Begode",
-                    "system_voltage": self.system_voltage,
+                    "system_voltage": system_voltage,
                 }
+                return result
 
         except (struct.error, IndexError) as e:
             _LOGGER.debug(f"Gotway decode error: {e}")
@@ -655,17 +738,7 @@ class GotwayDecoder(EucDecoder):
 
     def _detect_voltage(self, voltage: float) -> None:
         """Auto-detect system voltage based on measured voltage."""
-        if voltage > 115.0:
-            if voltage > 140.0:
-                self.system_voltage = 151.2  # 36S
-            else:
-                self.system_voltage = 126.0  # 30S
-        elif voltage > 90.0:
-            self.system_voltage = 100.8  # 24S
-        elif voltage > 75.0:
-            self.system_voltage = 84.0  # 20S
-        else:
-            self.system_voltage = 67.2  # 16S
+        self.system_voltage = _GW_VOLTAGES[bisect_left(_GW_THRESHOLDS, voltage)]
 
 
 # Placeholder decoders for InMotion and Ninebot
@@ -675,69 +748,69 @@ class InMotionUnpacker:
     """Unpacker for InMotion V1 protocol CAN-style frames.
     
     Frame format: AA AA [len] [data...] [checksum] [checksum]
-    Special escape: A5 -> escaped
+    Special escape: A5 -> escaped (the next byte is taken literally)
     """
 
+    HEADER = bytes([0xAA, 0xAA])
+    ESCAPE = 0xA5
+
     def __init__(self) -> None:
         self.buffer = bytearray()
-        self.state = UnpackerState.UNKNOWN
-        self.length = 0
-        self.escape_next = False
-
-    def add_char(self, c: int) -> bool:
-        """Add a character to the buffer. Returns True when frame is complete."""
-        if self.state == UnpackerState.UNKNOWN:
-            if c == 0xAA:
-                self.buffer.clear()
-                self.buffer.append(c)
-                self.state = UnpackerState.LENSEARCH
-            return False
-        
-        elif self.state == UnpackerState.LENSEARCH:
-            self.buffer.append(c)
-            if len(self.buffer) == 2:
-                if c == 0xAA:
-                    # Valid header AA AA
-                    self.state = UnpackerState.LENSEARCH
-                else:
-                    # Invalid, reset
-                    self.state = UnpackerState.UNKNOWN
-            elif len(self.buffer) == 3:
-                # This is the length byte
-                self.length = c
-                self.state = UnpackerState.COLLECTING
-            return False
-        
-        elif self.state == UnpackerState.COLLECTING:
-            # Check for escape sequence (A5)
-            if c == 0xA5 and not self.escape_next:
-                self.escape_next = True
-                return False
-            
-            if self.escape_next:
-                # Un-escape the data
-                self.buffer.append(c)
-                self.escape_next = False
-            else:
-                self.buffer.append(c)
-            
-            # Frame complete when we have: header(2) + len(1) + data(len) + checksum(2)
-            expected_length = 2 + 1 + self.length + 2
-            if len(self.buffer) >= expected_length:
-                self.state = UnpackerState.DONE
-                return True
-            return False
-        
-        return False
-
-    def get_frame(self) -> Optional[bytes]:
-        """Get the complete frame if available."""
-        if self.state == UnpackerState.DONE:
-            frame = bytes(self.buffer)
-            self.buffer.clear()
-            self.state = UnpackerState.UNKNOWN
-            return frame
-        return None
+
+    def add_data(self, data: bytes) -> list[bytes]:
+        """Add data and return complete (unescaped) frames."""
+        buffer = self.buffer
+        buffer.extend(data)
+        frames = []
+        
+        pos = 0
+        while True:
+            header_pos = buffer.find(self.HEADER, pos)
+            if header_pos < 0:
+                # Keep the last byte, it may be the first half of a split header
+                pos = max(len(buffer) - 1, pos)
+                break
+            pos = header_pos
+            read = self._read_frame(buffer, pos)
+            if read is None:
+                # Wait for more data
+                break
+            frame, pos = read
+            frames.append(frame)
+        
+        if pos:
+            del buffer[:pos]
+        return frames
+
+    @classmethod
+    def _read_frame(cls, buffer: bytearray, start: int) -> Optional[tuple[bytes, int]]:
+        """Unescape the frame whose header is at start.
+        
+        Returns the frame and the buffer position just past it, or None if the
+        buffer does not hold the whole frame yet.
+        """
+        if start + 3 > len(buffer):
+            return None
+        # Header and length byte are taken as-is; after them come len data
+        # bytes plus 2 checksum bytes, counted after unescaping
+        remaining = buffer[start + 2] + 2
+        pos = start + 3
+        frame = bytearray(buffer[start:pos])
+        while True:
+            # Copy the run up to the next escape in one slice
+            end = pos + remaining
+            escape_pos = buffer.find(cls.ESCAPE, pos, end)
+            if escape_pos < 0:
+                if end > len(buffer):
+                    return None
+                frame += buffer[pos:end]
+                return bytes(frame), end
+            if escape_pos + 1 >= len(buffer):
+                return None
+            frame += buffer[pos:escape_pos]
+            frame.append(buffer[escape_pos + 1])
+            remaining -= escape_pos - pos + 1
+            pos = escape_pos + 2
 
 
 class InMotionDecoder(EucDecoder):
@@ -750,10 +823,18 @@ class InMotionDecoder(EucDecoder):
     - Requires password authentication on some models
     """
 
+    # Request live data: AA AA 09 01 01 01 01 01 01 01 01 01 [checksum]
+    # Simplified request for live data (constant, so built once)
+    _KEEPALIVE_PACKET = bytes([0xAA, 0xAA, 0x09, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x00, 0x00])
+
+    # Live data fields from offset 1: voltage, speed, trip, total distance, current, temperature
+    _LIVE_DATA = struct.Struct(">HhIIhh")
+
     def __init__(self) -> None:
         super().__init__()
         self.unpacker = InMotionUnpacker()
         self.system_voltage = 84.0  # Default 20S, will be detected
+        self._sv_detected = False  # Latched once the first live voltage is seen
         self.password_sent = False
 
     @property
@@ -762,9 +843,7 @@ class InMotionDecoder(EucDecoder):
 
     def get_keepalive_packet(self) -> Optional[bytes]:
         """Return keepalive/request packet for InMotion V1."""
-        # Request live data: AA AA 09 01 01 01 01 01 01 01 01 01 [checksum]
-        # Simplified request for live data
-        return bytes([0xAA, 0xAA, 0x09, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x00, 0x00])
+        return self._KEEPALIVE_PACKET
 
     def _calculate_checksum(self, data: bytes) -> int:
         """Calculate InMotion checksum (sum of all bytes)."""
@@ -774,14 +853,15 @@ class InMotionDecoder(EucDecoder):
         """Decode InMotion V1 protocol data."""
         self.packet_count += 1
         
-        # Feed data into unpacker
-        for byte in data:
-            if self.unpacker.add_char(byte):
-                frame = self.unpacker.get_frame()
-                if frame:
-                    return self._parse_frame(frame)
+        frames = self.unpacker.add_data(data)
+        result = None
+        
+        for frame in frames:
+            decoded = self._parse_frame(frame)
+            if decoded:
+                result = decoded
         
-        return None
+        return result
 
     def _parse_frame(self, frame: bytes) -> Optional[dict[str, Any]]:
         """Parse a complete InMotion V1 frame."""
@@ -800,7 +880,7 @@ class InMotionDecoder(EucDecoder):
         
         # Extract checksum (last 2 bytes)
         payload = frame[2:2+length+1]  # length byte + data
-        checksum_received = struct.unpack(">H", frame[-2:])[0]
+        checksum_received = _U16_BE.unpack_from(frame, -2)[0]
         checksum_calculated = self._calculate_checksum(payload)
         
         if checksum_received != checksum_calculated:
@@ -823,30 +903,24 @@ class InMotionDecoder(EucDecoder):
         
         try:
             # InMotion V1 live data structure (approximate, needs verification)
-            voltage = struct.unpack(">H", data[1:3])[0] / 100.0
-            speed = struct.unpack(">h", data[3:5])[0] / 100.0
-            trip_distance = struct.unpack(">I", data[5:9])[0] / 1000.0
-            total_distance = struct.unpack(">I", data[9:13])[0] / 1000.0
-            current = struct.unpack(">h", data[13:15])[0] / 100.0
-            temperature = struct.unpack(">h", data[15:17])[0] / 100.0
+            (
+                voltage_raw, speed_raw, trip_raw, total_raw, current_raw, temperature_raw,
+            ) = self._LIVE_DATA.unpack_from(data, 1)
+            voltage = voltage_raw / 100.0
+            speed = speed_raw / 100.0
+            trip_distance = trip_raw / 1000.0
+            total_distance = total_raw / 1000.0
+            current = current_raw / 100.0
+            temperature = temperature_raw / 100.0
             
             # Detect system voltage from first packet
-            if voltage > 60 and self.system_voltage == 84.0:
+            if not self._sv_detected and voltage > 60:
                 # Auto-detect based on voltage
-                if voltage > 150:
-                    self.system_voltage = 176.4  # 42S
-                elif voltage > 140:
-                    self.system_voltage = 151.2  # 36S
-                elif voltage > 115:
-                    self.system_voltage = 126.0  # 30S
-                elif voltage > 95:
-                    self.system_voltage = 100.8  # 24S
-                elif voltage > 75:
-                    self.system_voltage = 84.0   # 20S
-                else:
-                    self.system_voltage = 67.2   # 16S
+                self.system_voltage = _AUTO_VOLTAGES[bisect_left(_AUTO_THRESHOLDS, voltage)]
+                self._sv_detected = True
             
-            battery_percent = self.calculate_battery_percent(voltage, self.system_voltage)
+            system_voltage = self.system_voltage
+            battery_percent = self.calculate_battery_percent(voltage, system_voltage)
             
             # InMotion charging detection (current > 0 and speed ~= 0)
             is_charging = current > 0.5 and abs(speed) < 1.0
@@ -864,10 +938,10 @@ class InMotionDecoder(EucDecoder):
                 "model": "InMotion V1",
                 "version": "1.0",
                 "manufacturer": "InMotion",
-                "system_voltage": self.system_voltage,
+                "system_voltage": system_voltage,
             }
             
-            self.last_telemetry = EucTelemetry(**telemetry)
+            self._last_result = telemetry
             return telemetry
             
         except (struct.error, IndexError) as ex:
@@ -876,61 +950,53 @@ class InMotionDecoder(EucDecoder):
             return None
 
 
-class InMotionV2Unpacker:
-    """Unpacker for InMotion V2 protocol frames.
+class FramedUnpacker:
+    """Unpacker for length-prefixed frames: [header] [len] [payload...] [checksum].
     
-    Frame format: DC 5A [len] [command] [data...] [checksum]
-    Similar to Veteran but with different command structure
+    Shared by protocols that differ only in their two header bytes:
+    - InMotion V2: DC 5A [len] [command] [data...] [checksum]
+    - Ninebot: 55 AA [len] [addr] [cmd] [data...] [checksum] [checksum]
+    - Ninebot Z: 5A A5 [len] [addr] [cmd] [data...] [checksum] [checksum]
     """
 
-    def __init__(self) -> None:
+    def __init__(self, header: bytes, trailer_len: int = 2) -> None:
+        self.header = header
+        # Bytes around the payload: header + length byte + checksum
+        self._overhead = len(header) + 1 + trailer_len
         self.buffer = bytearray()
-        self.state = UnpackerState.UNKNOWN
-        self.length = 0
-
-    def add_char(self, c: int) -> bool:
-        """Add a character to the buffer. Returns True when frame is complete."""
-        if self.state == UnpackerState.UNKNOWN:
-            if c == 0xDC:
-                self.buffer.clear()
-                self.buffer.append(c)
-                self.state = UnpackerState.LENSEARCH
-            return False
-        
-        elif self.state == UnpackerState.LENSEARCH:
-            self.buffer.append(c)
-            if len(self.buffer) == 2:
-                if c == 0x5A:
-                    # Valid header DC 5A
-                    self.state = UnpackerState.LENSEARCH
-                else:
-                    # Invalid, reset
-                    self.state = UnpackerState.UNKNOWN
-            elif len(self.buffer) == 3:
-                # This is the length byte
-                self.length = c
-                self.state = UnpackerState.COLLECTING
-            return False
-        
-        elif self.state == UnpackerState.COLLECTING:
-            self.buffer.append(c)
-            # Frame complete when we have: header(2) + len(1) + data(len) + checksum(2)
-            expected_length = 2 + 1 + self.length + 2
-            if len(self.buffer) >= expected_length:
-                self.state = UnpackerState.DONE
-                return True
-            return False
-        
-        return False
-
-    def get_frame(self) -> Optional[bytes]:
-        """Get the complete frame if available."""
-        if self.state == UnpackerState.DONE:
-            frame = bytes(self.buffer)
-            self.buffer.clear()
-            self.state = UnpackerState.UNKNOWN
-            return frame
-        return None
+
+    def add_data(self, data: bytes) -> list[bytes]:
+        """Add data and return complete frames."""
+        buffer = self.buffer
+        buffer.extend(data)
+        header = self.header
+        len_index = len(header)
+        overhead = self._overhead
+        frames = []
+        
+        pos = 0
+        with memoryview(buffer) as view:
+            while True:
+                # Look for header (C-level search skips noise in one call)
+                header_pos = buffer.find(header, pos)
+                if header_pos < 0:
+                    # Keep the last byte, it may be the first half of a split header
+                    pos = max(len(buffer) - 1, pos)
+                    break
+                pos = header_pos
+                if pos + len_index + 1 > len(buffer):
+                    # Wait for the length byte
+                    break
+                end = pos + overhead + buffer[pos + len_index]
+                if end > len(buffer):
+                    # Wait for the rest of the frame
+                    break
+                frames.append(view[pos:end].tobytes())
+                pos = end
+        
+        if pos:
+            del buffer[:pos]
+        return frames
 
 
 class InMotionV2Decoder(EucDecoder):
@@ -942,10 +1008,19 @@ class InMotionV2Decoder(EucDecoder):
     - Newer InMotion models (V11+)
     """
 
+    # Live data fields: voltage, speed, trip, total distance, current, temperature
+    _LIVE_DATA = struct.Struct(">HhIIhh")
+
+    # Request live data: DC 5A 05 01 [data] [checksum]
+    # Simplified request for live data, checksum is XOR of all bytes except header
+    _KEEPALIVE_BODY = bytes([0x05, 0x01, 0x00, 0x00, 0x00, 0x00])
+    _KEEPALIVE_PACKET = bytes([0xDC, 0x5A]) + _KEEPALIVE_BODY + _U16_BE.pack(_xor_bytes(_KEEPALIVE_BODY))
+
     def __init__(self) -> None:
         super().__init__()
-        self.unpacker = InMotionV2Unpacker()
+        self.unpacker = FramedUnpacker(b"\xdc\x5a")
         self.system_voltage = 100.8  # Default 24S, will be detected
+        self._sv_detected = False  # Latched once the first live voltage is seen
 
     @property
     def brand(self) -> WheelBrand:
@@ -953,35 +1028,25 @@ class InMotionV2Decoder(EucDecoder):
 
     def get_keepalive_packet(self) -> Optional[bytes]:
         """Return keepalive/request packet for InMotion V2."""
-        # Request live data: DC 5A 05 01 [data] [checksum]
-        # Simplified request for live data
-        packet = bytearray([0xDC, 0x5A, 0x05, 0x01, 0x00, 0x00, 0x00, 0x00])
-        # Add checksum (XOR of all bytes except header)
-        checksum = 0
-        for b in packet[2:]:
-            checksum ^= b
-        packet.extend(struct.pack(">H", checksum))
-        return bytes(packet)
+        return self._KEEPALIVE_PACKET
 
     def _calculate_checksum(self, data: bytes) -> int:
         """Calculate InMotion V2 checksum (XOR of data bytes)."""
-        checksum = 0
-        for b in data:
-            checksum ^= b
-        return checksum
+        return _xor_bytes(data)
 
     def decode(self, data: bytes) -> Optional[dict[str, Any]]:
         """Decode InMotion V2 protocol data."""
         self.packet_count += 1
         
-        # Feed data into unpacker
-        for byte in data:
-            if self.unpacker.add_char(byte):
-                frame = self.unpacker.get_frame()
-                if frame:
-                    return self._parse_frame(frame)
+        frames = self.unpacker.add_data(data)
+        result = None
         
-        return None
+        for frame in frames:
+            decoded = self._parse_frame(frame)
+            if decoded:
+                result = decoded
+        
+        return result
 
     def _parse_frame(self, frame: bytes) -> Optional[dict[str, Any]]:
         """Parse a complete InMotion V2 frame."""
@@ -1000,7 +1065,7 @@ class InMotionV2Decoder(EucDecoder):
         
         # Extract checksum (last 2 bytes)
         payload = frame[2:2+length+1]  # length byte + data
-        checksum_received = struct.unpack(">H", frame[-2:])[0]
+        checksum_received = _U16_BE.unpack_from(frame, -2)[0]
         checksum_calculated = self._calculate_checksum(payload)
         
         if checksum_received != checksum_calculated:
@@ -1023,42 +1088,30 @@ class InMotionV2Decoder(EucDecoder):
         
         try:
             # InMotion V2 live data structure (based on WheelLog)
-            voltage = struct.unpack(">H", data[0:2])[0] / 100.0
-            speed = struct.unpack(">h", data[2:4])[0] / 100.0
-            trip_distance = struct.unpack(">I", data[4:8])[0] / 1000.0
-            total_distance = struct.unpack(">I", data[8:12])[0] / 1000.0
-            current = struct.unpack(">h", data[12:14])[0] / 100.0
-            temperature = struct.unpack(">h", data[14:16])[0] / 100.0
+            (
+                voltage_raw, speed_raw, trip_raw, total_raw, current_raw, temperature_raw,
+            ) = self._LIVE_DATA.unpack_from(data, 0)
+            voltage = voltage_raw / 100.0
+            speed = speed_raw / 100.0
+            trip_distance = trip_raw / 1000.0
+            total_distance = total_raw / 1000.0
+            current = current_raw / 100.0
+            temperature = temperature_raw / 100.0
             
             # Model info (if present in extended packets)
             model = "InMotion V2"
             if len(data) > 20:
-                # Try to extract model name
-                try:
-                    model_bytes = data[20:30]
-                    model = model_bytes.decode('ascii', errors='ignore').strip('\x00')
-                    if not model:
-                        model = "InMotion V2"
-                except:
-                    pass
+                # Try to extract model name (decoding with errors='ignore' cannot raise)
+                model = data[20:30].decode('ascii', errors='ignore').strip('\x00') or model
             
             # Detect system voltage from first packet
-            if voltage > 60 and self.system_voltage == 100.8:
+            if not self._sv_detected and voltage > 60:
                 # Auto-detect based on voltage
-                if voltage > 150:
-                    self.system_voltage = 176.4  # 42S (V14)
-                elif voltage > 140:
-                    self.system_voltage = 151.2  # 36S
-                elif voltage > 115:
-                    self.system_voltage = 126.0  # 30S (V13)
-                elif voltage > 95:
-                    self.system_voltage = 100.8  # 24S (V11/V12)
-                elif voltage > 75:
-                    self.system_voltage = 84.0   # 20S
-                else:
-                    self.system_voltage = 67.2   # 16S
+                self.system_voltage = _AUTO_VOLTAGES[bisect_left(_AUTO_THRESHOLDS, voltage)]
+                self._sv_detected = True
             
-            battery_percent = self.calculate_battery_percent(voltage, self.system_voltage)
+            system_voltage = self.system_voltage
+            battery_percent = self.calculate_battery_percent(voltage, system_voltage)
             
             # InMotion charging detection (current > 0 and speed ~= 0)
             is_charging = current > 0.5 and abs(speed) < 1.0
@@ -1076,10 +1129,10 @@ class InMotionV2Decoder(EucDecoder):
                 "model": model,
                 "version": "2.0",
                 "manufacturer": "InMotion",
-                "system_voltage": self.system_voltage,
+                "system_voltage": system_voltage,
             }
             
-            self.last_telemetry = EucTelemetry(**telemetry)
+            self._last_result = telemetry
             return telemetry
             
         except (struct.error, IndexError) as ex:
@@ -1097,9 +1150,14 @@ class NinebotEncryption:
     The key is generated based on the serial number and session.
     """
 
+    # Key stream precomputed by init_key: the gamma key repeated to cover the
+    # longest frame (255 length + addr/cmd/checksum) from any starting offset
+    _KEYSTREAM_SPAN = 512
+
     def __init__(self) -> None:
         self.gamma_key = bytearray()
         self.key_index = 0
+        self._keystream = b""
 
     def init_key(self, serial: str = "N2GUS12345678") -> None:
         """Initialize the gamma key from serial number.
@@ -1116,6 +1174,8 @@ class NinebotEncryption:
         while len(self.gamma_key) < 16:
             self.gamma_key.append(self.gamma_key[len(self.gamma_key) % len(serial)])
         
+        key_len = len(self.gamma_key)
+        self._keystream = bytes(self.gamma_key) * ((key_len + self._KEYSTREAM_SPAN) // key_len + 1)
         self.key_index = 0
 
     def encrypt(self, data: bytes | bytearray) -> bytes:
@@ -1123,74 +1183,25 @@ class NinebotEncryption:
         if not self.gamma_key:
             self.init_key()
         
-        encrypted = bytearray()
-        for byte in data:
-            encrypted.append(byte ^ self.gamma_key[self.key_index % len(self.gamma_key)])
-            self.key_index = (self.key_index + 1) % len(self.gamma_key)
+        # XOR the whole message against the key stream (the key repeated from
+        # key_index) as one big integer instead of byte by byte
+        key_len = len(self.gamma_key)
+        length = len(data)
+        start = self.key_index % key_len
+        end = start + length
+        keystream = self._keystream
+        if end > len(keystream):
+            # Longer than any frame, repeat the key for this message only
+            keystream = bytes(self.gamma_key) * (end // key_len + 1)
+        self.key_index = end % key_len
         
-        return bytes(encrypted)
+        return (int.from_bytes(data, "big") ^ int.from_bytes(keystream[start:end], "big")).to_bytes(length, "big")
 
     def decrypt(self, data: bytes | bytearray) -> bytes:
         """Decrypt data using XOR with gamma key (same as encrypt for XOR)."""
         return self.encrypt(data)
 
 
-class NinebotUnpacker:
-    """Unpacker for Ninebot protocol frames.
-    
-    Frame format: 55 AA [len] [addr] [cmd] [data...] [checksum] [checksum]
-    """
-
-    def __init__(self) -> None:
-        self.buffer = bytearray()
-        self.state = UnpackerState.UNKNOWN
-        self.length = 0
-
-    def add_char(self, c: int) -> bool:
-        """Add a character to the buffer. Returns True when frame is complete."""
-        if self.state == UnpackerState.UNKNOWN:
-            if c == 0x55:
-                self.buffer.clear()
-                self.buffer.append(c)
-                self.state = UnpackerState.LENSEARCH
-            return False
-        
-        elif self.state == UnpackerState.LENSEARCH:
-            self.buffer.append(c)
-            if len(self.buffer) == 2:
-                if c == 0xAA:
-                    # Valid header 55 AA
-                    self.state = UnpackerState.LENSEARCH
-                else:
-                    # Invalid, reset
-                    self.state = UnpackerState.UNKNOWN
-            elif len(self.buffer) == 3:
-                # This is the length byte
-                self.length = c
-                self.state = UnpackerState.COLLECTING
-            return False
-        
-        elif self.state == UnpackerState.COLLECTING:
-            self.buffer.append(c)
-            # Frame complete when we have: header(2) + len(1) + addr(1) + cmd(1) + data(len-2) + checksum(2)
-            expected_length = 2 + 1 + self.length + 2
-            if len(self.buffer) >= expected_length:
-                self.state = UnpackerState.DONE
-                return True
-            return False
-        
-        return False
-
-    def get_frame(self) -> Optional[bytes]:
-        """Get the complete frame if available."""
-        if self.state == UnpackerState.DONE:
-            frame = bytes(self.buffer)
-            self.buffer.clear()
-            self.state = UnpackerState.UNKNOWN
-            return frame
-        return None
-
-
 class NinebotDecoder(EucDecoder):
     """Decoder for Ninebot wheels (standard protocol).
     
@@ -1200,11 +1211,23 @@ class NinebotDecoder(EucDecoder):
     - Frame structure: 55 AA [len] [addr] [cmd] [data...] [checksum]
     """
 
+    static_keepalive = False
+
+    # Live data fields (little-endian): voltage, current, speed, trip, total distance, temperature
+    _LIVE_DATA = struct.Struct("<HhhIIh")
+
+    # Request live data: 55 AA [len] [addr] [cmd] [data] [checksum]
+    # Command 0x01 to BMS (addr 0x22) for live data. The checksum (inverted XOR of
+    # all bytes after the header) is fixed; the rolling encryption is applied per send.
+    _KEEPALIVE_HEADER = bytes([0x55, 0xAA, 0x03])
+    _KEEPALIVE_PLAIN = bytes([0x22, 0x01]) + _U16_LE.pack(_xor_bytes(bytes([0x03, 0x22, 0x01])) ^ 0xFFFF)
+
     def __init__(self) -> None:
         super().__init__()
-        self.unpacker = NinebotUnpacker()
+        self.unpacker = FramedUnpacker(b"\x55\xaa")
         self.encryption = NinebotEncryption()
         self.system_voltage = 84.0  # Default 20S, will be detected
+        self._sv_detected = False  # Latched once the first live voltage is seen
         self.encryption.init_key()  # Initialize with default key
 
     @property
@@ -1213,43 +1236,26 @@ class NinebotDecoder(EucDecoder):
 
     def get_keepalive_packet(self) -> Optional[bytes]:
         """Return keepalive/request packet for Ninebot."""
-        # Request live data: 55 AA [len] [addr] [cmd] [data] [checksum]
-        # Command 0x01 to BMS (addr 0x22) for live data
-        packet = bytearray([0x55, 0xAA, 0x03, 0x22, 0x01])
-        
-        # Calculate checksum (XOR of all bytes after header)
-        checksum = 0
-        for b in packet[2:]:
-            checksum ^= b
-        checksum ^= 0xFFFF  # Ninebot uses inverted checksum
-        
-        packet.extend(struct.pack("<H", checksum))
-        
         # Encrypt the data portion (after header and length)
-        data_to_encrypt = packet[3:]
-        encrypted_data = self.encryption.encrypt(data_to_encrypt)
-        
-        return bytes(packet[:3]) + encrypted_data
+        return self._KEEPALIVE_HEADER + self.encryption.encrypt(self._KEEPALIVE_PLAIN)
 
     def _calculate_checksum(self, data: bytes) -> int:
         """Calculate Ninebot checksum (XOR of data bytes, inverted)."""
-        checksum = 0
-        for b in data:
-            checksum ^= b
-        return checksum ^ 0xFFFF
+        return _xor_bytes(data) ^ 0xFFFF
 
     def decode(self, data: bytes) -> Optional[dict[str, Any]]:
         """Decode Ninebot protocol data."""
         self.packet_count += 1
         
-        # Feed data into unpacker
-        for byte in data:
-            if self.unpacker.add_char(byte):
-                frame = self.unpacker.get_frame()
-                if frame:
-                    return self._parse_frame(frame)
+        frames = self.unpacker.add_data(data)
+        result = None
         
-        return None
+        for frame in frames:
+            decoded = self._parse_frame(frame)
+            if decoded:
+                result = decoded
+        
+        return result
 
     def _parse_frame(self, frame: bytes) -> Optional[dict[str, Any]]:
         """Parse a complete Ninebot frame."""
@@ -1266,19 +1272,16 @@ class NinebotDecoder(EucDecoder):
         if len(frame) < 3 + length + 2:
             return None
         
-        # Decrypt the data portion (after length byte)
-        encrypted_portion = frame[3:]
-        decrypted_portion = self.encryption.decrypt(encrypted_portion)
-        
-        # Reconstruct frame with decrypted data
-        decrypted_frame = frame[:3] + decrypted_portion
+        # Decrypt the data portion (after length byte): addr + cmd + data + checksum
+        decrypted = self.encryption.decrypt(frame[3:])
         
         # Extract checksum (last 2 bytes)
-        addr = decrypted_frame[3]
-        cmd = decrypted_frame[4]
-        payload = decrypted_frame[2:-2]  # length + addr + cmd + data
-        checksum_received = struct.unpack("<H", decrypted_frame[-2:])[0]
-        checksum_calculated = self._calculate_checksum(payload)
+        addr = decrypted[0]
+        cmd = decrypted[1]
+        checksum_received = _U16_LE.unpack_from(decrypted, -2)[0]
+        # The checksum covers length + addr + cmd + data; XOR-ing the length byte in
+        # afterwards avoids rebuilding the decrypted frame just to include it
+        checksum_calculated = self._calculate_checksum(decrypted[:-2]) ^ length
         
         if checksum_received != checksum_calculated:
             _LOGGER.warning("Ninebot checksum mismatch: expected %04x, got %04x", checksum_calculated, checksum_received)
@@ -1287,7 +1290,7 @@ class NinebotDecoder(EucDecoder):
         
         # Parse data based on command
         if addr == 0x22 and cmd == 0x01:  # BMS live data response
-            return self._parse_live_data(decrypted_frame[5:-2])
+            return self._parse_live_data(decrypted[2:-2])
         
         return None
 
@@ -1298,30 +1301,24 @@ class NinebotDecoder(EucDecoder):
         
         try:
             # Ninebot live data structure (based on WheelLog)
-            voltage = struct.unpack("<H", data[0:2])[0] / 100.0
-            current = struct.unpack("<h", data[2:4])[0] / 100.0
-            speed = struct.unpack("<h", data[4:6])[0] / 100.0
-            trip_distance = struct.unpack("<I", data[6:10])[0] / 1000.0
-            total_distance = struct.unpack("<I", data[10:14])[0] / 1000.0
-            temperature = struct.unpack("<h", data[14:16])[0] / 10.0
+            (
+                voltage_raw, current_raw, speed_raw, trip_raw, total_raw, temperature_raw,
+            ) = self._LIVE_DATA.unpack_from(data, 0)
+            voltage = voltage_raw / 100.0
+            current = current_raw / 100.0
+            speed = speed_raw / 100.0
+            trip_distance = trip_raw / 1000.0
+            total_distance = total_raw / 1000.0
+            temperature = temperature_raw / 10.0
             
             # Detect system voltage from first packet
-            if voltage > 60 and self.system_voltage == 84.0:
+            if not self._sv_detected and voltage > 60:
                 # Auto-detect based on voltage
-                if voltage > 150:
-                    self.system_voltage = 176.4  # 42S
-                elif voltage > 140:
-                    self.system_voltage = 151.2  # 36S
-                elif voltage > 115:
-                    self.system_voltage = 126.0  # 30S
-                elif voltage > 95:
-                    self.system_voltage = 100.8  # 24S
-                elif voltage > 75:
-                    self.system_voltage = 84.0   # 20S
-                else:
-                    self.system_voltage = 67.2   # 16S
+                self.system_voltage = _AUTO_VOLTAGES[bisect_left(_AUTO_THRESHOLDS, voltage)]
+                self._sv_detected = True
             
-            battery_percent = self.calculate_battery_percent(voltage, self.system_voltage)
+            system_voltage = self.system_voltage
+            battery_percent = self.calculate_battery_percent(voltage, system_voltage)
             
             # Ninebot charging detection
             is_charging = current > 0.5 and abs(speed) < 1.0
@@ -1339,10 +1336,10 @@ class NinebotDecoder(EucDecoder):
                 "model": "Ninebot",
                 "version": "1.0",
                 "manufacturer": "Ninebot",
-                "system_voltage": self.system_voltage,
+                "system_voltage": system_voltage,
             }
             
-            self.last_telemetry = EucTelemetry(**telemetry)
+            self._last_result = telemetry
             return telemetry
             
         except (struct.error, IndexError) as ex:
@@ -1351,63 +1348,6 @@ class NinebotDecoder(EucDecoder):
             return None
 
 
-class NinebotZUnpacker:
-    """Unpacker for Ninebot Z protocol frames.
-    
-    Frame format: 5A A5 [len] [addr] [cmd] [data...] [checksum] [checksum]
-    Similar to standard Ninebot but with different header
-    """
-
-    def __init__(self) -> None:
-        self.buffer = bytearray()
-        self.state = UnpackerState.UNKNOWN
-        self.length = 0
-
-    def add_char(self, c: int) -> bool:
-        """Add a character to the buffer. Returns True when frame is complete."""
-        if self.state == UnpackerState.UNKNOWN:
-            if c == 0x5A:
-                self.buffer.clear()
-                self.buffer.append(c)
-                self.state = UnpackerState.LENSEARCH
-            return False
-        
-        elif self.state == UnpackerState.LENSEARCH:
-            self.buffer.append(c)
-            if len(self.buffer) == 2:
-                if c == 0xA5:
-                    # Valid header 5A A5
-                    self.state = UnpackerState.LENSEARCH
-                else:
-                    # Invalid, reset
-                    self.state = UnpackerState.UNKNOWN
-            elif len(self.buffer) == 3:
-                # This is the length byte
-                self.length = c
-                self.state = UnpackerState.COLLECTING
-            return False
-        
-        elif self.state == UnpackerState.COLLECTING:
-            self.buffer.append(c)
-            # Frame complete when we have: header(2) + len(1) + addr(1) + cmd(1) + data(len-2) + checksum(2)
-            expected_length = 2 + 1 + self.length + 2
-            if len(self.buffer) >= expected_length:
-                self.state = UnpackerState.DONE
-                return True
-            return False
-        
-        return False
-
-    def get_frame(self) -> Optional[bytes]:
-        """Get the complete frame if available."""
-        if self.state == UnpackerState.DONE:
-            frame = bytes(self.buffer)
-            self.buffer.clear()
-            self.state = UnpackerState.UNKNOWN
-            return frame
-        return None
-
-
 class NinebotZDecoder(EucDecoder):
     """Decoder for Ninebot Z series wheels (Z6, Z8, Z10).
     
@@ -1418,11 +1358,26 @@ class NinebotZDecoder(EucDecoder):
     - High-performance models with different frame header
     """
 
+    static_keepalive = False
+
+    # Live data fields (little-endian): voltage, current, speed, trip, total distance, temperature
+    _LIVE_DATA = struct.Struct("<HhhIIh")
+
+    # Model name bytes count only if they hold an ASCII letter or digit (searched in C)
+    _MODEL_ALNUM = re.compile(rb"[A-Za-z0-9]")
+
+    # Request live data: 5A A5 [len] [addr] [cmd] [data] [checksum]
+    # Command 0x01 to BMS (addr 0x22) for live data. The checksum (inverted XOR of
+    # all bytes after the header) is fixed; the rolling encryption is applied per send.
+    _KEEPALIVE_HEADER = bytes([0x5A, 0xA5, 0x03])
+    _KEEPALIVE_PLAIN = bytes([0x22, 0x01]) + _U16_LE.pack(_xor_bytes(bytes([0x03, 0x22, 0x01])) ^ 0xFFFF)
+
     def __init__(self) -> None:
         super().__init__()
-        self.unpacker = NinebotZUnpacker()
+        self.unpacker = FramedUnpacker(b"\x5a\xa5")
         self.encryption = NinebotEncryption()
         self.system_voltage = 126.0  # Default 30S (Z10), will be detected
+        self._sv_detected = False  # Latched once the first live voltage is seen
         self.encryption.init_key()  # Initialize with default key
 
     @property
@@ -1431,43 +1386,26 @@ class NinebotZDecoder(EucDecoder):
 
     def get_keepalive_packet(self) -> Optional[bytes]:
         """Return keepalive/request packet for Ninebot Z."""
-        # Request live data: 5A A5 [len] [addr] [cmd] [data] [checksum]
-        # Command 0x01 to BMS (addr 0x22) for live data
-        packet = bytearray([0x5A, 0xA5, 0x03, 0x22, 0x01])
-        
-        # Calculate checksum (XOR of all bytes after header)
-        checksum = 0
-        for b in packet[2:]:
-            checksum ^= b
-        checksum ^= 0xFFFF  # Ninebot uses inverted checksum
-        
-        packet.extend(struct.pack("<H", checksum))
-        
         # Encrypt the data portion (after header and length)
-        data_to_encrypt = packet[3:]
-        encrypted_data = self.encryption.encrypt(data_to_encrypt)
-        
-        return bytes(packet[:3]) + encrypted_data
+        return self._KEEPALIVE_HEADER + self.encryption.encrypt(self._KEEPALIVE_PLAIN)
 
     def _calculate_checksum(self, data: bytes) -> int:
         """Calculate Ninebot Z checksum (XOR of data bytes, inverted)."""
-        checksum = 0
-        for b in data:
-            checksum ^= b
-        return checksum ^ 0xFFFF
+        return _xor_bytes(data) ^ 0xFFFF
 
     def decode(self, data: bytes) -> Optional[dict[str, Any]]:
         """Decode Ninebot Z protocol data."""
         self.packet_count += 1
         
-        # Feed data into unpacker
-        for byte in data:
-            if self.unpacker.add_char(byte):
-                frame = self.unpacker.get_frame()
-                if frame:
-                    return self._parse_frame(frame)
+        frames = self.unpacker.add_data(data)
+        result = None
         
-        return None
+        for frame in frames:
+            decoded = self._parse_frame(frame)
+            if decoded:
+                result = decoded
+        
+        return result
 
     def _parse_frame(self, frame: bytes) -> Optional[dict[str, Any]]:
         """Parse a complete Ninebot Z frame."""
@@ -1484,19 +1422,16 @@ class NinebotZDecoder(EucDecoder):
         if len(frame) < 3 + length + 2:
             return None
         
-        # Decrypt the data portion (after length byte)
-        encrypted_portion = frame[3:]
-        decrypted_portion = self.encryption.decrypt(encrypted_portion)
-        
-        # Reconstruct frame with decrypted data
-        decrypted_frame = frame[:3] + decrypted_portion
+        # Decrypt the data portion (after length byte): addr + cmd + data + checksum
+        decrypted = self.encryption.decrypt(frame[3:])
         
         # Extract checksum (last 2 bytes)
-        addr = decrypted_frame[3]
-        cmd = decrypted_frame[4]
-        payload = decrypted_frame[2:-2]  # length + addr + cmd + data
-        checksum_received = struct.unpack("<H", decrypted_frame[-2:])[0]
-        checksum_calculated = self._calculate_checksum(payload)
+        addr = decrypted[0]
+        cmd = decrypted[1]
+        checksum_received = _U16_LE.unpack_from(decrypted, -2)[0]
+        # The checksum covers length + addr + cmd + data; XOR-ing the length byte in
+        # afterwards avoids rebuilding the decrypted frame just to include it
+        checksum_calculated = self._calculate_checksum(decrypted[:-2]) ^ length
         
         if checksum_received != checksum_calculated:
             _LOGGER.warning("Ninebot Z checksum mismatch: expected %04x, got %04x", checksum_calculated, checksum_received)
@@ -1505,7 +1440,7 @@ class NinebotZDecoder(EucDecoder):
         
         # Parse data based on command
         if addr == 0x22 and cmd == 0x01:  # BMS live data response
-            return self._parse_live_data(decrypted_frame[5:-2])
+            return self._parse_live_data(decrypted[2:-2])
         
         return None
 
@@ -1516,41 +1451,30 @@ class NinebotZDecoder(EucDecoder):
         
         try:
             # Ninebot Z live data structure (similar to standard but may have extended fields)
-            voltage = struct.unpack("<H", data[0:2])[0] / 100.0
-            current = struct.unpack("<h", data[2:4])[0] / 100.0
-            speed = struct.unpack("<h", data[4:6])[0] / 100.0
-            trip_distance = struct.unpack("<I", data[6:10])[0] / 1000.0
-            total_distance = struct.unpack("<I", data[10:14])[0] / 1000.0
-            temperature = struct.unpack("<h", data[14:16])[0] / 10.0
+            (
+                voltage_raw, current_raw, speed_raw, trip_raw, total_raw, temperature_raw,
+            ) = self._LIVE_DATA.unpack_from(data, 0)
+            voltage = voltage_raw / 100.0
+            current = current_raw / 100.0
+            speed = speed_raw / 100.0
+            trip_distance = trip_raw / 1000.0
+            total_distance = total_raw / 1000.0
+            temperature = temperature_raw / 10.0
             
             # Try to extract model name from extended data
             model = "Ninebot Z"
-            if len(data) > 20:
-                try:
-                    model_bytes = data[20:30]
-                    model_str = model_bytes.decode('ascii', errors='ignore').strip('\x00')
-                    if model_str and any(c.isalnum() for c in model_str):
-                        model = f"Ninebot {model_str}"
-                except:
-                    pass
+            if len(data) > 20 and self._MODEL_ALNUM.search(data, 20, 30):
+                model_str = data[20:30].decode('ascii', errors='ignore').strip('\x00')
+                model = f"Ninebot {model_str}"
             
             # Detect system voltage from first packet
-            if voltage > 60 and self.system_voltage == 126.0:
+            if not self._sv_detected and voltage > 60:
                 # Auto-detect based on voltage (Z series typically higher voltage)
-                if voltage > 150:
-                    self.system_voltage = 176.4  # 42S
-                elif voltage > 140:
-                    self.system_voltage = 151.2  # 36S
-                elif voltage > 115:
-                    self.system_voltage = 126.0  # 30S (Z10 default)
-                elif voltage > 95:
-                    self.system_voltage = 100.8  # 24S
-                elif voltage > 75:
-                    self.system_voltage = 84.0   # 20S (Z6/Z8)
-                else:
-                    self.system_voltage = 67.2   # 16S
+                self.system_voltage = _AUTO_VOLTAGES[bisect_left(_AUTO_THRESHOLDS, voltage)]
+                self._sv_detected = True
             
-            battery_percent = self.calculate_battery_percent(voltage, self.system_voltage)
+            system_voltage = self.system_voltage
+            battery_percent = self.calculate_battery_percent(voltage, system_voltage)
             
             # Ninebot Z charging detection
             is_charging = current > 0.5 and abs(speed) < 1.0
@@ -1568,10 +1492,10 @@ class NinebotZDecoder(EucDecoder):
                 "model": model,
                 "version": "Z1.0",
                 "manufacturer": "Ninebot",
-                "system_voltage": self.system_voltage,
+                "system_voltage": system_voltage,
             }
             
-            self.last_telemetry = EucTelemetry(**telemetry)
+            self._last_result = telemetry
             return telemetry
             
         except (struct.error, IndexError) as ex:
@@ -1580,6 +1504,106 @@ class NinebotZDecoder(EucDecoder):
             return None
 
 
+def _detect_55aa(data: bytes) -> Optional[type[EucDecoder]]:
+    """Disambiguate 55 AA: Gotway (55 AA DC 5A) or Ninebot (55 AA [len] [cmd])."""
+    if len(data) < 4:
+        return None
+    
+    # Unique 4-byte header - Gotway (55 AA DC 5A)
+    if data[2] == 0xDC and data[3] == 0x5A:
+        _LOGGER.debug("Detected Gotway/Begode protocol (55 AA DC 5A header)")
+        return GotwayDecoder
+    
+    # Ninebot uses 55 AA like Gotway but WITHOUT DC 5A after
+    # Typical len is 0x03-0x20, cmd is 0x01-0x04 for common requests
+    packet_len = data[2]
+    cmd = data[3]
+    if packet_len != 0xDC and 0x03 <= packet_len <= 0x30:
+        _LOGGER.debug("Detected Ninebot protocol (55 AA, len=%02x, cmd=%02x)", packet_len, cmd)
+        return NinebotDecoder
+    return None
+
+
+def _detect_dc5a(data: bytes) -> Optional[type[EucDecoder]]:
+    """Disambiguate DC 5A: Veteran (DC 5A 5C) or InMotion V2 (DC 5A [flags])."""
+    if len(data) < 3:
+        return None
+    
+    flags = data[2]
+    if flags == 0x5C:
+        if len(data) >= 4:
+            _LOGGER.debug("Detected Veteran/Leaperkim protocol (DC 5A 5C header)")
+            return VeteranDecoder
+        return None
+    
+    # Known V2 flags: 0x01-0x1F (not 0x5C which is Veteran)
+    if flags <= 0x1F:
+        _LOGGER.debug("Detected InMotion V2 protocol (DC 5A, flags=%02x)", flags)
+        return InMotionV2Decoder
+    return None
+
+
+def _detect_5aa5(data: bytes) -> Optional[type[EucDecoder]]:
+    """Detect Ninebot Z (5A A5 [len] [cmd])."""
+    if len(data) < 4:
+        return None
+    _LOGGER.debug("Detected Ninebot Z protocol (5A A5 header)")
+    return NinebotZDecoder
+
+
+def _detect_aa55(data: bytes) -> Optional[type[EucDecoder]]:
+    """Detect KingSong (AA 55 [len] [cmd])."""
+    if len(data) < 4:
+        return None
+    
+    # KingSong uses cmd=0xA9 for live data, len is typically 0x14-0x18
+    packet_len = data[2]
+    if 0x14 <= packet_len <= 0x30:
+        if data[3] == 0xA9:
+            _LOGGER.debug("Detected KingSong protocol (AA 55, len=%02x, cmd=A9)", packet_len)
+        else:
+            # Likely KingSong even without cmd check
+            _LOGGER.debug("Detected KingSong protocol (AA 55, len=%02x)", packet_len)
+        return KingSongDecoder
+    return None
+
+
+def _detect_aaaa(data: bytes) -> Optional[type[EucDecoder]]:
+    """Detect InMotion V1 (AA AA [len] [cmd])."""
+    if len(data) < 4:
+        return None
+    
+    # InMotion V1 uses CAN-style frames, len is typically 0x09-0x0F
+    packet_len = data[2]
+    if 0x09 <= packet_len <= 0x20:
+        _LOGGER.debug("Detected InMotion V1 protocol (AA AA, len=%02x)", packet_len)
+        return InMotionDecoder
+    return None
+
+
+# First two header bytes -> resolver that disambiguates using the following bytes
+_HEADER_DISPATCH: dict[bytes, Callable[[bytes], Optional[type[EucDecoder]]]] = {
+    b"\x55\xaa": _detect_55aa,
+    b"\xdc\x5a": _detect_dc5a,
+    b"\x5a\xa5": _detect_5aa5,
+    b"\xaa\x55": _detect_aa55,
+    b"\xaa\xaa": _detect_aaaa,
+}
+
+
+@lru_cache(maxsize=64)
+def _detect_decoder_class(header: bytes) -> Optional[type[EucDecoder]]:
+    """Return the decoder class for a packet's first (up to) four bytes.
+    
+    Detection never looks past byte 3, so the answer is cached per header and
+    packets repeating an undetected header skip the resolvers.
+    """
+    resolver = _HEADER_DISPATCH.get(header[:2])
+    if resolver is None:
+        return None
+    return resolver(header)
+
+
 def get_decoder_by_data(data: bytes) -> Optional[EucDecoder]:
     """Factory to create the correct decoder based on initial packet header.
     
@@ -1592,74 +1616,17 @@ def get_decoder_by_data(data: bytes) -> Optional[EucDecoder]:
     - AA AA [len] [cmd]: InMotion V1 (min 4 bytes, CAN-style)
     - 5A A5 [len] [cmd]: Ninebot Z (min 4 bytes, Z-series header)
     
-    Protocol detection priority (to handle overlapping headers):
-    1. Check unique 4-byte headers first (Gotway 55 AA DC 5A)
-    2. Check unique 3-byte headers (Veteran DC 5A 5C, Ninebot Z 5A A5)
-    3. Disambiguate 2-byte headers (55 AA, AA 55, AA AA, DC 5A) using subsequent bytes
+    The first two bytes select a resolver in a single dict lookup; headers
+    shared by two protocols (55 AA, DC 5A) are disambiguated there using the
+    subsequent bytes, with the unique longer header checked first. The
+    resulting class is cached per 4-byte header and a fresh instance returned.
     """
     if len(data) < 2:
         return None
     
-    # Priority 1: Unique 4-byte header - Gotway (55 AA DC 5A)
-    if len(data) >= 4 and data[0] == 0x55 and data[1] == 0xAA and data[2] == 0xDC and data[3] == 0x5A:
-        _LOGGER.debug("Detected Gotway/Begode protocol (55 AA DC 5A header)")
-        return GotwayDecoder()
-    
-    # Priority 2: Unique 3-byte headers
-    
-    # Check for Veteran (DC 5A 5C)
-    if len(data) >= 4 and data[0] == 0xDC and data[1] == 0x5A and data[2] == 0x5C:
-        _LOGGER.debug("Detected Veteran/Leaperkim protocol (DC 5A 5C header)")
-        return VeteranDecoder()
-    
-    # Check for Ninebot Z (5A A5)
-    if len(data) >= 4 and data[0] == 0x5A and data[1] == 0xA5:
-        _LOGGER.debug("Detected Ninebot Z protocol (5A A5 header)")
-        return NinebotZDecoder()
-    
-    # Priority 3: Disambiguate 2-byte headers using subsequent bytes
-    
-    # Check for KingSong (AA 55 [len] [cmd])
-    # KingSong uses cmd=0xA9 for live data, len is typically 0x14-0x18
-    if len(data) >= 4 and data[0] == 0xAA and data[1] == 0x55:
-        packet_len = data[2]
-        cmd = data[3] if len(data) > 3 else 0
-        if packet_len >= 0x14 and packet_len <= 0x30 and cmd == 0xA9:
-            _LOGGER.debug("Detected KingSong protocol (AA 55, len=%02x, cmd=A9)", packet_len)
-            return KingSongDecoder()
-        elif packet_len >= 0x14 and packet_len <= 0x30:
-            # Likely KingSong even without cmd check
-            _LOGGER.debug("Detected KingSong protocol (AA 55, len=%02x)", packet_len)
-            return KingSongDecoder()
-    
-    # Check for InMotion V1 (AA AA [len] [cmd])
-    # InMotion V1 uses CAN-style frames, len is typically 0x09-0x0F
-    if len(data) >= 4 and data[0] == 0xAA and data[1] == 0xAA:
-        packet_len = data[2]
-        if packet_len >= 0x09 and packet_len <= 0x20:
-            _LOGGER.debug("Detected InMotion V1 protocol (AA AA, len=%02x)", packet_len)
-            return InMotionDecoder()
-    
-    # Check for InMotion V2 (DC 5A [flags])
-    # InMotion V2 uses flags byte after DC 5A (not 5C like Veteran)
-    if len(data) >= 3 and data[0] == 0xDC and data[1] == 0x5A:
-        flags = data[2]
-        # Known V2 flags: 0x01-0x1F (not 0x5C which is Veteran)
-        if flags != 0x5C and flags <= 0x1F:
-            _LOGGER.debug("Detected InMotion V2 protocol (DC 5A, flags=%02x)", flags)
-            return InMotionV2Decoder()
-    
-    # Check for Ninebot standard (55 AA [len] [cmd])
-    # Ninebot uses 55 AA like Gotway but WITHOUT DC 5A after
-    # Typical len is 0x03-0x20, cmd is 0x01-0x04 for common requests
-    if len(data) >= 4 and data[0] == 0x55 and data[1] == 0xAA:
-        packet_len = data[2]
-        cmd = data[3] if len(data) > 3 else 0
-        # If NOT followed by DC 5A (Gotway marker), assume Ninebot
-        if data[2] != 0xDC:
-            if packet_len >= 0x03 and packet_len <= 0x30:
-                _LOGGER.debug("Detected Ninebot protocol (55 AA, len=%02x, cmd=%02x)", packet_len, cmd)
-                return NinebotDecoder()
+    decoder_class = _detect_decoder_class(bytes(data[:4]))
+    if decoder_class is not None:
+        return decoder_class()
     
     # Fallback: Log unknown protocol with more context
     hex_dump = data[:min(8, len(data))].hex()
@@ -1667,21 +1634,23 @@ def get_decoder_by_data(data: bytes) -> Optional[EucDecoder]:
     return None
 
 
+# Brand -> decoder class, built once rather than on every factory call
+_BRAND_DECODERS: dict[WheelBrand, type[EucDecoder]] = {
+    WheelBrand.VETERAN: VeteranDecoder,
+    WheelBrand.LEAPERKIM: VeteranDecoder,
+    WheelBrand.KINGSONG: KingSongDecoder,
+    WheelBrand.GOTWAY: GotwayDecoder,
+    WheelBrand.BEGODE: GotwayDecoder,
+    WheelBrand.INMOTION: InMotionDecoder,
+    WheelBrand.INMOTION_V2: InMotionV2Decoder,
+    WheelBrand.NINEBOT: NinebotDecoder,
+    WheelBrand.NINEBOT_Z: NinebotZDecoder,
+}
+
+
 def get_decoder_by_brand(brand: WheelBrand) -> Optional[EucDecoder]:
     """Create a decoder for a specific brand."""
-    brand_map = {
-        WheelBrand.VETERAN: VeteranDecoder,
-        WheelBrand.LEAPERKIM: VeteranDecoder,
-        WheelBrand.KINGSONG: KingSongDecoder,
-        WheelBrand.GOTWAY: GotwayDecoder,
-        WheelBrand.BEGODE: GotwayDecoder,
-        WheelBrand.INMOTION: InMotionDecoder,
-        WheelBrand.INMOTION_V2: InMotionV2Decoder,
-        WheelBrand.NINEBOT: NinebotDecoder,
-        WheelBrand.NINEBOT_Z: NinebotZDecoder,
-    }
-    
-    decoder_class = brand_map.get(brand)
+    decoder_class = _BRAND_DECODERS.get(brand)
     if decoder_class:
         return decoder_class()
     
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from operator import attrgetter, itemgetter
 from typing import Callable, Any
 
 from homeassistant.components.sensor import (
@@ -34,10 +35,65 @@ from .charge_tracker import ChargeEstimates
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+def _no_value(data: dict[str, Any]) -> None:
+    """Value function for sensors that have no value in the telemetry."""
+    return None
+
+
+@dataclass(frozen=True, kw_only=True)
 class EucChargingSensorDescription(SensorEntityDescription):
     """Class describing Leaperkim sensor entities."""
-    value_fn: Callable[[dict[str, Any]], Any] = lambda x: None
+    value_fn: Callable[[dict[str, Any]], Any] = _no_value
+    extra_attrs_fn: Callable[[dict[str, Any]], dict[str, Any] | None] | None = None
+
+
+def _voltage_attrs(data: dict[str, Any]) -> dict[str, Any] | None:
+    """Add system voltage to the voltage sensor."""
+    return {
+        "system_voltage": data.get("system_voltage"),
+    }
+
+
+def _battery_attrs(data: dict[str, Any]) -> dict[str, Any] | None:
+    """Add charge estimates to the battery sensor."""
+    estimates: ChargeEstimates | None = data.get("charge_estimates")
+    if not estimates or estimates.charge_rate_pct <= 0:
+        return None
+    attrs = {
+        "charge_rate_pct_min": estimates.charge_rate_pct,
+        "averaging_window": estimates.averaging_window,
+    }
+    if estimates.time_to_80 is not None:
+        attrs["time_to_80"] = estimates.time_to_80_formatted
+    if estimates.time_to_90 is not None:
+        attrs["time_to_90"] = estimates.time_to_90_formatted
+    if estimates.time_to_95 is not None:
+        attrs["time_to_95"] = estimates.time_to_95_formatted
+    if estimates.time_to_100 is not None:
+        attrs["time_to_100"] = estimates.time_to_100_formatted
+    return attrs
+
+
+def _est_attr(
+    attr: str, default: Any, default_if_none: bool = False
+) -> Callable[[dict[str, Any]], Any]:
+    """Build a value_fn reading one ChargeEstimates attribute while charging.
+    
+    Returns default when there are no estimates (the coordinator only provides
+    them while charging), and also when the attribute is None if default_if_none is set.
+    """
+    get_value = attrgetter(attr)
+
+    def value_fn(data: dict[str, Any]) -> Any:
+        estimates = data.get("charge_estimates")
+        if not estimates:
+            return default
+        value = get_value(estimates)
+        if value is None and default_if_none:
+            return default
+        return value
+
+    return value_fn
 
 
 SENSORS: tuple[EucChargingSensorDescription, ...] = (
@@ -48,7 +104,8 @@ SENSORS: tuple[EucChargingSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=2,
-        value_fn=lambda data: data.get("voltage"),
+        value_fn=itemgetter("voltage"),
+        extra_attrs_fn=_voltage_attrs,
     ),
     EucChargingSensorDescription(
         key="battery_percent",
@@ -56,7 +113,8 @@ SENSORS: tuple[EucChargingSensorDescription, ...] = (
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("battery_percent"),
+        value_fn=itemgetter("battery_percent"),
+        extra_attrs_fn=_battery_attrs,
     ),
     EucChargingSensorDescription(
         key="total_distance",
@@ -65,7 +123,7 @@ SENSORS: tuple[EucChargingSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfLength.KILOMETERS,
         state_class=SensorStateClass.TOTAL_INCREASING,
         suggested_display_precision=2,
-        value_fn=lambda data: data.get("total_distance"),
+        value_fn=itemgetter("total_distance"),
     ),
     EucChargingSensorDescription(
         key="temperature",
@@ -73,48 +131,32 @@ SENSORS: tuple[EucChargingSensorDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("temperature"),
+        value_fn=itemgetter("temperature"),
     ),
     # Charge time estimate sensors
     EucChargingSensorDescription(
         key="charge_time_to_80",
         name="Time to 80%",
         icon="mdi:battery-charging-80",
-        value_fn=lambda data: (
-            data.get("charge_estimates").time_to_80_formatted 
-            if data.get("charge_estimates") and data.get("is_charging") 
-            else "0:00 hr"  # Show 0:00 when not charging
-        ),
+        value_fn=_est_attr("time_to_80_formatted", "0:00 hr"),  # Show 0:00 when not charging
     ),
     EucChargingSensorDescription(
         key="charge_time_to_90",
         name="Time to 90%",
         icon="mdi:battery-charging-90",
-        value_fn=lambda data: (
-            data.get("charge_estimates").time_to_90_formatted 
-            if data.get("charge_estimates") and data.get("is_charging") 
-            else "0:00 hr"  # Show 0:00 when not charging
-        ),
+        value_fn=_est_attr("time_to_90_formatted", "0:00 hr"),  # Show 0:00 when not charging
     ),
     EucChargingSensorDescription(
         key="charge_time_to_95",
         name="Time to 95%",
         icon="mdi:battery-charging-high",
-        value_fn=lambda data: (
-            data.get("charge_estimates").time_to_95_formatted 
-            if data.get("charge_estimates") and data.get("is_charging") 
-            else "0:00 hr"  # Show 0:00 when not charging
-        ),
+        value_fn=_est_attr("time_to_95_formatted", "0:00 hr"),  # Show 0:00 when not charging
     ),
     EucChargingSensorDescription(
         key="charge_time_to_100",
         name="Time to 100%",
         icon="mdi:battery-charging-100",
-        value_fn=lambda data: (
-            data.get("charge_estimates").time_to_100_formatted 
-            if data.get("charge_estimates") and data.get("is_charging") 
-            else "0:00 hr"  # Show 0:00 when not charging
-        ),
+        value_fn=_est_attr("time_to_100_formatted", "0:00 hr"),  # Show 0:00 when not charging
     ),
     EucChargingSensorDescription(
         key="charge_rate",
@@ -123,19 +165,15 @@ SENSORS: tuple[EucChargingSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         icon="mdi:speedometer",
-        value_fn=lambda data: (
-            data.get("charge_estimates").charge_rate_pct 
-            if data.get("charge_estimates") and data.get("is_charging") 
-            and data.get("charge_estimates").charge_rate_pct is not None 
-            else 0  # Show 0 when not charging instead of None/Unknown
-        ),
+        # Show 0 when not charging instead of None/Unknown
+        value_fn=_est_attr("charge_rate_pct", 0, default_if_none=True),
     ),
     # Last connected/updated sensors (persist even when disconnected)
     EucChargingSensorDescription(
         key="last_connected_time",
         name="Last Connected",
         icon="mdi:clock-outline",
-        value_fn=lambda data: data.get("last_connected_time"),
+        value_fn=itemgetter("last_connected_time"),
     ),
     EucChargingSensorDescription(
         key="last_voltage",
@@ -145,7 +183,7 @@ SENSORS: tuple[EucChargingSensorDescription, ...] = (
         suggested_display_precision=2,
         icon="mdi:battery-clock",
         entity_registry_enabled_default=False,
-        value_fn=lambda data: None,  # We'll override this in the sensor class
+        value_fn=_no_value,  # We'll override this in the sensor class
     ),
     EucChargingSensorDescription(
         key="last_battery_percent",
@@ -154,7 +192,7 @@ SENSORS: tuple[EucChargingSensorDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         icon="mdi:battery-clock",
         entity_registry_enabled_default=False,
-        value_fn=lambda data: None,  # We'll override this in the sensor class
+        value_fn=_no_value,  # We'll override this in the sensor class
     ),
     EucChargingSensorDescription(
         key="last_trip_distance",
@@ -164,7 +202,7 @@ SENSORS: tuple[EucChargingSensorDescription, ...] = (
         suggested_display_precision=2,
         icon="mdi:map-marker-distance",
         entity_registry_enabled_default=False,
-        value_fn=lambda data: None,  # We'll override this in the sensor class
+        value_fn=_no_value,  # We'll override this in the sensor class
     ),
     EucChargingSensorDescription(
         key="last_total_distance",
@@ -174,7 +212,7 @@ SENSORS: tuple[EucChargingSensorDescription, ...] = (
         suggested_display_precision=2,
         icon="mdi:counter",
         entity_registry_enabled_default=False,
-        value_fn=lambda data: None,  # We'll override this in the sensor class
+        value_fn=_no_value,  # We'll override this in the sensor class
     ),
 )
 
@@ -187,8 +225,15 @@ async def async_setup_entry(
     """Set up the Leaperkim sensors."""
     coordinator: EucChargingCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    # Only sensors with extra attributes get the class that computes them;
+    # the rest keep the base entity's static None
     async_add_entities(
-        EucChargingSensor(coordinator, description) for description in SENSORS
+        [
+            EucChargingAttributesSensor(coordinator, description)
+            if description.extra_attrs_fn is not None
+            else EucChargingSensor(coordinator, description)
+            for description in SENSORS
+        ]
     )
 
 
@@ -217,18 +262,7 @@ class EucChargingSensor(CoordinatorEntity[EucChargingCoordinator], SensorEntity)
     @property
     def device_info(self) -> DeviceInfo:
         """Return the device info."""
-        data = self.coordinator.data or {}
-        model = data.get("model", "Unknown Model")
-        manufacturer = data.get("manufacturer", "Leaperkim")
-        sw_version = data.get("version")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.ble_device.address)},
-            name=f"{manufacturer} {model} ({self.coordinator.ble_device.name})",
-            manufacturer=manufacturer,
-            model=model,
-            sw_version=sw_version,
-        )
+        return self.coordinator.get_device_info()
 
     @property
     def available(self) -> bool:
@@ -273,38 +307,23 @@ class EucChargingSensor(CoordinatorEntity[EucChargingCoordinator], SensorEntity)
             return None
         
         # All other sensors use the normal value_fn
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
+            return None
+        try:
+            return self.entity_description.value_fn(data)
+        except KeyError:
+            # itemgetter value_fns raise for keys the decoder didn't report
             return None
-        return self.entity_description.value_fn(self.coordinator.data)
+
+
+class EucChargingAttributesSensor(EucChargingSensor):
+    """Leaperkim sensor whose description provides extra state attributes."""
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-            
-        # Add system voltage to the voltage sensor
-        if self.entity_description.key == "voltage":
-            return {
-                "system_voltage": self.coordinator.data.get("system_voltage"),
-            }
-            
-        # Add charge estimates to the battery sensor
-        if self.entity_description.key == "battery_percent":
-            estimates: ChargeEstimates | None = self.coordinator.data.get("charge_estimates")
-            if estimates and estimates.charge_rate_pct > 0:
-                attrs = {
-                    "charge_rate_pct_min": estimates.charge_rate_pct,
-                    "averaging_window": estimates.averaging_window,
-                }
-                if estimates.time_to_80 is not None:
-                    attrs["time_to_80"] = estimates.time_to_80_formatted
-                if estimates.time_to_90 is not None:
-                    attrs["time_to_90"] = estimates.time_to_90_formatted
-                if estimates.time_to_95 is not None:
-                    attrs["time_to_95"] = estimates.time_to_95_formatted
-                if estimates.time_to_100 is not None:
-                    attrs["time_to_100"] = estimates.time_to_100_formatted
-                return attrs
-            
-        return None
+        return self.entity_description.extra_attrs_fn(data)
@@ -46,21 +46,19 @@ class EucAutoConnectSwitch(SwitchEntity):
         wheel_id = sanitize_wheel_id(coordinator.ble_device.name or "euc")
         self._attr_suggested_object_id = f"euc_{wheel_id}_auto_connect"
         
+        # Device info doesn't depend on telemetry, so build it once
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.ble_device.address)},
+            name=coordinator.ble_device.name or "EUC",
+            manufacturer="Leaperkim",
+            connections={("bluetooth", coordinator.ble_device.address)},
+        )
+        
         self._attr_is_on = True  # Default to enabled
         
         # Initialize the coordinator's auto-connect state
         self._coordinator.auto_connect_enabled = True
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._coordinator.ble_device.address)},
-            name=self._coordinator.ble_device.name or "EUC",
-            manufacturer="Leaperkim",
-            connections={("bluetooth", self._coordinator.ble_device.address)},
-        )
-
     @property
     def available(self) -> bool:
         """Return if entity is available."""
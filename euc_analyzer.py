@@ -33,6 +33,16 @@ from typing import Any, Dict, List, Optional, Tuple
 class PacketAnalyzer:
     """Analyzes BLE packet data to identify patterns and structures."""
     
+    # Known protocol headers (hex) -> description, matched against observed 2/3-byte headers
+    PROTOCOL_HEADERS = {
+        "dc5a5c": "Veteran/Leaperkim protocol detected (DC 5A 5C)",
+        "aa55": "KingSong protocol detected (AA 55)",
+        "55aa": "Gotway/Begode protocol detected (55 AA)",
+        "dc5a": "InMotion V2 protocol detected (DC 5A)",
+        "aaaa": "InMotion V1 protocol detected (AA AA)",
+        "5aa5": "Ninebot Z protocol detected (5A A5)",
+    }
+    
     def __init__(self, capture_data: Dict[str, Any]):
         self.metadata = capture_data.get("metadata", {})
         self.raw_packets = capture_data.get("raw_packets", [])
@@ -128,18 +138,11 @@ class PacketAnalyzer:
         # Detect known protocols
         print()
         print("  Protocol detection:")
-        if any(h.startswith("dc5a5c") for h in header_3byte.keys()):
-            print("    ✓ Veteran/Leaperkim protocol detected (DC 5A 5C)")
-        if any(h.startswith("aa55") for h in header_2byte.keys()):
-            print("    ✓ KingSong protocol detected (AA 55)")
-        if any(h.startswith("55aa") for h in header_2byte.keys()):
-            print("    ✓ Gotway/Begode protocol detected (55 AA)")
-        if any(h.startswith("dc5a") for h in header_2byte.keys()):
-            print("    ✓ InMotion V2 protocol detected (DC 5A)")
-        if any(h.startswith("aaaa") for h in header_2byte.keys()):
-            print("    ✓ InMotion V1 protocol detected (AA AA)")
-        if any(h.startswith("5aa5") for h in header_2byte.keys()):
-            print("    ✓ Ninebot Z protocol detected (5A A5)")
+        # Header keys are exactly 2 or 3 bytes long, so each known header is one set lookup
+        seen_headers = header_2byte.keys() | header_3byte.keys()
+        for header, description in self.PROTOCOL_HEADERS.items():
+            if header in seen_headers:
+                print(f"    ✓ {description}")
     
     def _analyze_packet_lengths(self) -> None:
         """Analyze distribution of packet lengths."""
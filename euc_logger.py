@@ -41,9 +41,9 @@ except ImportError:
 # Import our decoders
 sys.path.insert(0, str(Path(__file__).parent / "custom_components" / "euc_charging"))
 from const import (
-    ALL_SERVICE_UUIDS,
-    BRAND_DEVICE_NAMES,
+    ALL_SERVICE_UUIDS_SET,
     CELL_CONFIG,
+    match_brand,
     WheelBrand,
     KINGSONG_SERVICE_UUID,
     KINGSONG_READ_UUID,
@@ -150,7 +150,7 @@ class EucDataCapture:
         if self.decoder is None and self.auto_detect:
             self.decoder = get_decoder_by_data(data)
             if self.decoder:
-                _LOGGER.info(f"Auto-detected protocol: {self.decoder.brand.value}")
+                _LOGGER.info(f"Auto-detected protocol: {self.decoder.brand.str_value}")
         
         if self.decoder:
             try:
@@ -171,7 +171,7 @@ class EucDataCapture:
             
             # Check which service UUID is available
             for service in self.client.services:
-                if service.uuid in ALL_SERVICE_UUIDS or service.uuid.startswith("0000ffe0"):
+                if service.uuid in ALL_SERVICE_UUIDS_SET or service.uuid.startswith("0000ffe0"):
                     for char in service.characteristics:
                         if "notify" in char.properties:
                             notify_uuid = char.uuid
@@ -227,7 +227,7 @@ class EucDataCapture:
             # Generate filename
             CAPTURE_DIR.mkdir(exist_ok=True)
             timestamp = self.start_time.strftime("%Y%m%d_%H%M%S") if self.start_time else "unknown"
-            brand = self.brand.value if self.brand else "unknown"
+            brand = self.brand.str_value if self.brand else "unknown"
             model = self.model.replace(" ", "_").lower() if self.model else "unknown"
             filename = f"{timestamp}_{brand}_{model}.json"
             output_path = CAPTURE_DIR / filename
@@ -236,7 +236,7 @@ class EucDataCapture:
         capture_data = {
             "metadata": {
                 "mac_address": self.mac_address,
-                "brand": self.brand.value if self.brand else "unknown",
+                "brand": self.brand.str_value if self.brand else "unknown",
                 "model": self.model or "unknown",
                 "start_time": self.start_time.isoformat() if self.start_time else None,
                 "end_time": self.end_time.isoformat() if self.end_time else None,
@@ -271,18 +271,12 @@ async def scan_for_eucs() -> None:
         detected_brand = None
         
         if device.name:
-            for brand, patterns in BRAND_DEVICE_NAMES.items():
-                for pattern in patterns:
-                    if pattern.lower() in device.name.lower():
-                        is_euc = True
-                        detected_brand = brand
-                        break
-                if is_euc:
-                    break
+            detected_brand = match_brand(device.name)
+            is_euc = detected_brand is not None
         
         # Check service UUIDs
         for service_uuid in adv_data.service_uuids:
-            if service_uuid in ALL_SERVICE_UUIDS:
+            if service_uuid in ALL_SERVICE_UUIDS_SET:
                 is_euc = True
                 break
         
@@ -301,7 +295,7 @@ async def scan_for_eucs() -> None:
         print(f"  MAC Address: {device.address}")
         print(f"  RSSI: {adv_data.rssi} dBm")
         if brand:
-            print(f"  Detected Brand: {brand.value}")
+            print(f"  Detected Brand: {brand.str_value}")
         print(f"  Service UUIDs: {', '.join(adv_data.service_uuids)}")
         print()
 
@@ -319,10 +313,10 @@ async def capture_data(
     wheel_brand = None
     if brand:
         try:
-            wheel_brand = WheelBrand(brand.lower())
+            wheel_brand = WheelBrand.from_str(brand.lower())
         except ValueError:
             _LOGGER.error(f"Unknown brand: {brand}")
-            _LOGGER.info(f"Available brands: {', '.join([b.value for b in WheelBrand])}")
+            _LOGGER.info(f"Available brands: {', '.join([b.str_value for b in WheelBrand])}")
             return
     
     # Create capture instance
@@ -0,0 +1,111 @@
+"""Unit tests for the charge time estimator."""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import the custom component
+sys.path.insert(0, str(Path(__file__).parent.parent / "custom_components" / "euc_charging"))
+
+import unittest
+
+# Import directly from charge_tracker module to avoid __init__.py dependencies
+import charge_tracker
+
+ChargeEstimates = charge_tracker.ChargeEstimates
+LiIonChargeModel = charge_tracker.LiIonChargeModel
+_WindowRegression = charge_tracker._WindowRegression
+
+
+def _least_squares_slope(samples):
+    """Reference slope computed directly from a list of (t, soc) samples."""
+    n = len(samples)
+    mean_t = sum(t for t, _ in samples) / n
+    mean_soc = sum(soc for _, soc in samples) / n
+    cov = sum((t - mean_t) * (soc - mean_soc) for t, soc in samples)
+    var = sum((t - mean_t) ** 2 for t, _ in samples)
+    return cov / var
+
+
+class TestChargeEstimates(unittest.TestCase):
+    """Test the charge estimates container."""
+
+    def test_formatted_times(self):
+        """Test that formatted times are filled in at construction."""
+        estimates = ChargeEstimates(time_to_80=0, time_to_90=45, time_to_95=102)
+        self.assertEqual(estimates.time_to_80_formatted, "0:00 hr")
+        self.assertEqual(estimates.time_to_90_formatted, "0:45 hr")
+        self.assertEqual(estimates.time_to_95_formatted, "1:42 hr")
+        self.assertIsNone(estimates.time_to_100_formatted)
+
+
+class TestLiIonChargeModel(unittest.TestCase):
+    """Test the Li-ion charge curve model."""
+
+    def test_speed_factor_at_breakpoints(self):
+        """Test that every curve breakpoint is reproduced exactly."""
+        for soc, factor in LiIonChargeModel.CURVE_POINTS:
+            self.assertAlmostEqual(LiIonChargeModel.get_speed_factor(soc), factor)
+
+    def test_speed_factor_interpolates(self):
+        """Test linear interpolation between breakpoints."""
+        self.assertAlmostEqual(LiIonChargeModel.get_speed_factor(82.5), 0.925)
+        self.assertAlmostEqual(LiIonChargeModel.get_speed_factor(99.75), 0.0625)
+
+    def test_speed_factor_clamps(self):
+        """Test SOC values outside 0-100%."""
+        self.assertEqual(LiIonChargeModel.get_speed_factor(-5), 1.0)
+        self.assertEqual(LiIonChargeModel.get_speed_factor(105), 0.05)
+
+    def test_time_to_target_matches_numeric_integral(self):
+        """Test the closed-form integral against a fine midpoint sum."""
+        rate = 0.2
+        for current in (10.0, 82.0, 91.3, 97.0):
+            base_rate = rate / LiIonChargeModel.get_speed_factor(current)
+            steps = 20000
+            width = (100.0 - current) / steps
+            expected = sum(
+                width / (base_rate * LiIonChargeModel.get_speed_factor(current + (i + 0.5) * width))
+                for i in range(steps)
+            )
+            result = LiIonChargeModel.estimate_time_to_target(current, 100.0, rate)
+            self.assertLessEqual(abs(result - expected), 0.5 + 1e-6)
+
+    def test_time_to_target_edge_cases(self):
+        """Test targets already reached and non-positive rates."""
+        self.assertEqual(LiIonChargeModel.estimate_time_to_target(85.0, 80.0, 0.5), 0)
+        self.assertIsNone(LiIonChargeModel.estimate_time_to_target(50.0, 80.0, 0.0))
+        self.assertEqual(LiIonChargeModel.estimate_time_to_target(50.0, 80.0, 1.0), 30)
+
+
+class TestWindowRegression(unittest.TestCase):
+    """Test the sliding-window regression accumulator."""
+
+    def test_matches_direct_fit_while_sliding(self):
+        """Test the running slope against a direct fit as samples enter and expire."""
+        samples = [(i / 60.0, 40.0 + 0.2 * i / 60.0 + (i % 7) * 0.03) for i in range(600)]
+        window = _WindowRegression(60)
+        left = 0
+        for right, (t, soc) in enumerate(samples):
+            window.add(t, soc)
+            while samples[left][0] < t - 1.0:
+                window.remove(*samples[left])
+                left += 1
+            if right - left >= 1:
+                expected = _least_squares_slope(samples[left:right + 1])
+                self.assertAlmostEqual(window.slope, expected, places=9)
+
+    def test_degenerate_windows(self):
+        """Test windows with too few samples or no time span."""
+        window = _WindowRegression(60)
+        self.assertIsNone(window.slope)
+        window.add(1.0, 50.0)
+        self.assertIsNone(window.slope)
+        window.add(1.0, 51.0)
+        self.assertIsNone(window.slope)
+        window.remove(1.0, 50.0)
+        window.remove(1.0, 51.0)
+        self.assertEqual(window.n, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
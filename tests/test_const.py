@@ -0,0 +1,85 @@
+"""Unit tests for EUC constants and device name matching."""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import the custom component
+sys.path.insert(0, str(Path(__file__).parent.parent / "custom_components" / "euc_charging"))
+
+import unittest
+
+# Import directly from const module to avoid __init__.py dependencies
+import const
+
+WheelBrand = const.WheelBrand
+
+
+class TestBrandMatching(unittest.TestCase):
+    """Test brand detection from Bluetooth device names."""
+
+    def test_prefix_match(self):
+        """Test names that start with a known pattern."""
+        self.assertEqual(const.trie_match("KS-16X"), WheelBrand.KINGSONG)
+        self.assertEqual(const.trie_match("LK3336"), WheelBrand.VETERAN)
+        self.assertEqual(const.trie_match("mcm5"), WheelBrand.GOTWAY)
+        self.assertIsNone(const.trie_match("My Sherman"))
+
+    def test_prefix_match_prefers_longest(self):
+        """Test that the most specific pattern wins."""
+        self.assertEqual(const.trie_match("Ninebot Z10"), WheelBrand.NINEBOT_Z)
+        self.assertEqual(const.trie_match("Ninebot One"), WheelBrand.NINEBOT)
+
+    def test_match_brand_substring_fallback(self):
+        """Test names containing a pattern anywhere."""
+        self.assertEqual(const.match_brand("My Sherman"), WheelBrand.VETERAN)
+        self.assertEqual(const.match_brand("my kingsong wheel"), WheelBrand.KINGSONG)
+
+    def test_match_brand_shared_pattern(self):
+        """Test that a pattern listed by several brands resolves to the first."""
+        self.assertEqual(const.match_brand("V11-1234"), WheelBrand.INMOTION)
+
+    def test_match_brand_no_match(self):
+        """Test unknown and empty names."""
+        self.assertIsNone(const.match_brand("Random"))
+        self.assertIsNone(const.match_brand(""))
+        self.assertIsNone(const.match_brand(None))
+
+
+class TestDeviceNameMatching(unittest.TestCase):
+    """Test the discovery name filter."""
+
+    def test_known_names(self):
+        """Test names containing known patterns."""
+        self.assertTrue(const.match_device_name("LK3336"))
+        self.assertTrue(const.match_device_name("My Sherman S"))
+
+    def test_case_sensitive(self):
+        """Test that matching keeps the original case-sensitive semantics."""
+        self.assertFalse(const.match_device_name("iphone"))
+
+    def test_empty_name(self):
+        """Test empty and missing names."""
+        self.assertFalse(const.match_device_name(""))
+        self.assertFalse(const.match_device_name(None))
+
+
+class TestLookupTables(unittest.TestCase):
+    """Test precomputed lookup tables."""
+
+    def test_service_uuid_tables(self):
+        """Test service UUID lookups in both directions."""
+        self.assertEqual(
+            const.BRAND_TO_SERVICE_UUID[WheelBrand.KINGSONG], const.KINGSONG_SERVICE_UUID
+        )
+        self.assertIn(WheelBrand.VETERAN, const.SERVICE_UUID_TO_BRAND[const.VETERAN_SERVICE_UUID])
+        self.assertEqual(const.ALL_SERVICE_UUIDS_SET, frozenset(const.ALL_SERVICE_UUIDS))
+
+    def test_cell_config_by_cells(self):
+        """Test cell configuration lookup by series cell count."""
+        config = const.CELL_CONFIG_BY_CELLS[24]
+        self.assertEqual(config, const.CELL_CONFIG["24S"])
+        self.assertAlmostEqual(config.max_voltage, 100.8)
+
+
+if __name__ == "__main__":
+    unittest.main()
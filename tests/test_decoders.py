@@ -19,6 +19,10 @@ InMotionV2Decoder = decoders.InMotionV2Decoder
 NinebotDecoder = decoders.NinebotDecoder
 NinebotZDecoder = decoders.NinebotZDecoder
 get_decoder_by_data = decoders.get_decoder_by_data
+VeteranUnpacker = decoders.VeteranUnpacker
+InMotionUnpacker = decoders.InMotionUnpacker
+KingSongUnpacker = decoders.KingSongUnpacker
+FramedUnpacker = decoders.FramedUnpacker
 
 
 class TestVeteranDecoder(unittest.TestCase):
@@ -50,6 +54,23 @@ class TestVeteranDecoder(unittest.TestCase):
         # Veteran uses unpacker that accumulates BLE packets
         self.assertIsNone(result)
 
+    def test_veteran_reversed_big_endian_distances(self):
+        """Test that 32-bit distances are read low word first."""
+        frame = bytearray([0xDC, 0x5A, 0x5C, 0x20] + [0x00] * 32)
+        frame[8:12] = bytes([0x1A, 0x62, 0x00, 0x01])  # Trip: 0x0001_1A62 = 72290 m
+        frame[12:16] = bytes([0xFF, 0xC6, 0x00, 0x02])  # Total: 0x0002_FFC6 = 196550 m
+        result = self.decoder._decode_frame(bytes(frame))
+        self.assertAlmostEqual(result["trip_distance"], 72.290)
+        self.assertAlmostEqual(result["total_distance"], 196.550)
+
+    def test_veteran_decode_batch(self):
+        """Test that a frame split over buffered notifications decodes in one call."""
+        frame = bytes([0xDC, 0x5A, 0x5C, 0x20, 0x27, 0x10] + [0x00] * 30)
+        chunks = [b"\x00" + frame[:3], frame[3:20], frame[20:]]
+        result = self.decoder.decode_batch(chunks)
+        self.assertAlmostEqual(result["voltage"], 100.0)
+        self.assertEqual(result, VeteranDecoder()._decode_frame(frame))
+
     def test_veteran_protocol_detection(self):
         """Test that Veteran protocol is detected correctly."""
         packet = bytes([0xDC, 0x5A, 0x5C, 0x10])
@@ -57,6 +78,32 @@ class TestVeteranDecoder(unittest.TestCase):
         self.assertIsInstance(decoder, VeteranDecoder)
 
 
+class TestVeteranUnpacker(unittest.TestCase):
+    """Test Veteran frame assembly."""
+
+    FRAME = bytes([0xDC, 0x5A, 0x5C, 0x20]) + bytes(range(1, 19)) + bytes(14)
+
+    def test_frame_split_across_packets(self):
+        """Test a frame and its header split over several packets."""
+        unpacker = VeteranUnpacker()
+        self.assertEqual(unpacker.add_data(b"\x01\x02" + self.FRAME[:2]), [])
+        self.assertEqual(unpacker.add_data(self.FRAME[2:30]), [])
+        self.assertEqual(unpacker.add_data(self.FRAME[30:] + b"\xdc"), [self.FRAME])
+        self.assertEqual(unpacker.add_data(self.FRAME[1:]), [self.FRAME])
+
+    def test_invalid_byte_resyncs(self):
+        """Test that a frame failing validation is dropped and the next one found."""
+        bad = bytearray(self.FRAME)
+        bad[22] = 0x01
+        unpacker = VeteranUnpacker()
+        self.assertEqual(unpacker.add_data(bytes(bad) + self.FRAME), [self.FRAME])
+
+    def test_repeated_header_byte_resyncs(self):
+        """Test that a stray first header byte does not hide the real header."""
+        unpacker = VeteranUnpacker()
+        self.assertEqual(unpacker.add_data(b"\xdc\xdc\x5a" + self.FRAME[2:]), [self.FRAME])
+
+
 class TestKingSongDecoder(unittest.TestCase):
     """Test KingSong protocol decoder."""
 
@@ -92,6 +139,31 @@ class TestKingSongDecoder(unittest.TestCase):
         decoder = get_decoder_by_data(packet)
         self.assertIsInstance(decoder, KingSongDecoder)
 
+    def test_kingsong_voltage_detection_thresholds(self):
+        """Test that thresholds belong to the lower configuration."""
+        for voltage, expected in (
+            (60.0, 67.2), (75.0, 67.2), (75.01, 84.0), (90.0, 84.0),
+            (100.0, 100.8), (115.0, 100.8), (140.0, 126.0), (165.0, 151.2), (170.0, 176.4),
+        ):
+            self.decoder._detect_voltage(voltage)
+            self.assertEqual(self.decoder.system_voltage, expected, voltage)
+
+
+class TestKingSongUnpacker(unittest.TestCase):
+    """Test KingSong frame assembly."""
+
+    FRAME = bytes([0xAA, 0x55]) + bytes(range(1, 15)) + bytes([0x5A] * 4)
+
+    def test_noise_does_not_accumulate(self):
+        """Test that headerless noise is dropped except a possible half header."""
+        unpacker = KingSongUnpacker()
+        for _ in range(50):
+            self.assertEqual(unpacker.add_data(bytes(range(0x10, 0x50))), [])
+        self.assertLessEqual(len(unpacker.buffer), 1)
+        self.assertEqual(unpacker.add_data(b"\x00\xaa"), [])
+        self.assertEqual(unpacker.add_data(self.FRAME[1:]), [self.FRAME])
+        self.assertEqual(len(unpacker.buffer), 0)
+
 
 class TestGotwayDecoder(unittest.TestCase):
     """Test Gotway/Begode protocol decoder."""
@@ -117,6 +189,17 @@ class TestGotwayDecoder(unittest.TestCase):
         result = self.decoder.decode(packet)
         self.assertIsNone(result)  # Needs full frame
 
+    def test_gotway_last_telemetry(self):
+        """Test that last_telemetry reflects the latest decoded frame."""
+        self.assertEqual(self.decoder.last_telemetry.voltage, 0.0)
+        frame = bytes([0x55, 0xAA, 0x20, 0xD0] + [0x00] * 16)
+        result = self.decoder._decode_frame(frame)
+        self.assertEqual(result["voltage"], 84.0)
+        telemetry = self.decoder.last_telemetry
+        self.assertEqual(telemetry.voltage, 84.0)
+        self.assertEqual(telemetry.manufacturer, "Begode")
+        self.assertIs(self.decoder.last_telemetry, telemetry)
+
 
 class TestInMotionDecoder(unittest.TestCase):
     """Test InMotion V1 protocol decoder."""
@@ -139,6 +222,23 @@ class TestInMotionDecoder(unittest.TestCase):
         self.assertEqual(keepalive[0:2], bytes([0xAA, 0xAA]))
 
 
+class TestInMotionUnpacker(unittest.TestCase):
+    """Test InMotion V1 frame assembly."""
+
+    def test_escaped_frame_split_across_packets(self):
+        """Test that escape bytes are removed and do not count towards the length."""
+        unpacker = InMotionUnpacker()
+        self.assertEqual(unpacker.add_data(b"\x00\xaa\xaa\x03\x01\xa5"), [])
+        self.assertEqual(
+            unpacker.add_data(b"\xaa\xa5\xa5\x02\x03\xaa"),
+            [b"\xaa\xaa\x03\x01\xaa\xa5\x02\x03"],
+        )
+        self.assertEqual(
+            unpacker.add_data(b"\xaa\x00\x01\x02"),
+            [b"\xaa\xaa\x00\x01\x02"],
+        )
+
+
 class TestInMotionV2Decoder(unittest.TestCase):
     """Test InMotion V2 protocol decoder."""
 
@@ -157,6 +257,46 @@ class TestInMotionV2Decoder(unittest.TestCase):
         self.assertIsNotNone(keepalive)
         self.assertEqual(keepalive[0:2], bytes([0xDC, 0x5A]))
 
+    def test_inmotionv2_checksum(self):
+        """Test the XOR checksum against a byte-by-byte fold."""
+        for length in (0, 1, 2, 3, 7, 8, 9, 40, 64, 65):
+            data = bytes((i * 37 + 11) & 0xFF for i in range(length))
+            expected = 0
+            for byte in data:
+                expected ^= byte
+            self.assertEqual(self.decoder._calculate_checksum(data), expected)
+
+    def test_inmotionv2_voltage_detected_once(self):
+        """Test that system voltage is detected from the first live packet only."""
+        for voltage, expected in ((50.0, 100.8), (99.0, 100.8), (120.0, 100.8)):
+            data = int(voltage * 100).to_bytes(2, "big") + bytes(38)
+            result = self.decoder._parse_live_data(data)
+            self.assertEqual(result["system_voltage"], expected)
+
+
+class TestFramedUnpacker(unittest.TestCase):
+    """Test length-prefixed frame assembly shared by InMotion V2 and Ninebot."""
+
+    def test_frame_split_across_packets(self):
+        """Test that a frame is returned once its length byte is satisfied."""
+        unpacker = FramedUnpacker(b"\x5a\xa5")
+        self.assertEqual(unpacker.add_data(b"\x00\x5a"), [])
+        self.assertEqual(unpacker.add_data(b"\xa5\x02\x14\x01"), [])
+        self.assertEqual(
+            unpacker.add_data(b"\xaa\xbb\x5a\xa5\x00\x01"),
+            [b"\x5a\xa5\x02\x14\x01\xaa\xbb"],
+        )
+        self.assertEqual(unpacker.add_data(b"\x02"), [b"\x5a\xa5\x00\x01\x02"])
+
+    def test_repeated_header_byte_resyncs(self):
+        """Test that a stray first header byte does not hide the real header."""
+        unpacker = FramedUnpacker(b"\xdc\x5a")
+        self.assertEqual(unpacker.add_data(b"\xdc"), [])
+        self.assertEqual(
+            unpacker.add_data(b"\xdc\x5a\x01\x07\x00\x00"),
+            [b"\xdc\x5a\x01\x07\x00\x00"],
+        )
+
 
 class TestNinebotDecoder(unittest.TestCase):
     """Test Ninebot protocol decoder."""
@@ -249,6 +389,14 @@ class TestProtocolDetection(unittest.TestCase):
         decoder = get_decoder_by_data(packet)
         self.assertIsNone(decoder)
 
+    def test_detection_returns_new_decoder(self):
+        """Test that a repeated header still yields a separate decoder per call."""
+        packet = bytes([0xDC, 0x5A, 0x5C, 0x10, 0x00])
+        first = get_decoder_by_data(packet)
+        second = get_decoder_by_data(packet[:4])
+        self.assertIsInstance(second, VeteranDecoder)
+        self.assertIsNot(first, second)
+
 
 class TestBatteryCalculation(unittest.TestCase):
     """Test battery percentage calculation."""